@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+
+import asyncio
+import contextvars
+import uuid
+import httpx
+
+DEFAULT_BASE_URL = "https://globetrotter-app-6.preview.emergentagent.com/api"
+
+# Output lines of the scenario running in the current task; None means print immediately
+_scenario_output = contextvars.ContextVar("scenario_output", default=None)
+
+
+class AsyncAPITester:
+    """Shared async client core for the API test harnesses.
+
+    One pooled HTTP/2 client is shared by every scenario. Scenarios pass
+    their own tokens instead of mutating tester state, so independent
+    scenarios can run concurrently via run_scenarios().
+    """
+
+    # Appended to passing test names in the log
+    passed_suffix = " - PASSED"
+
+    # LLM-backed endpoints (itinerary/generate, chat) can take minutes, so no timeout by default
+    def __init__(self, base_url=DEFAULT_BASE_URL, max_connections=20, timeout=None):
+        self.base_url = base_url
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.client = None
+        self.tests_run = 0
+        self.tests_passed = 0
+        self.failed_tests = []
+        self.passed_tests = []
+
+    async def __aenter__(self):
+        self.client = httpx.AsyncClient(
+            http2=True,
+            timeout=self.timeout,
+            headers={'Content-Type': 'application/json'},
+            limits=httpx.Limits(max_connections=self.max_connections),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.client.aclose()
+        self.client = None
+
+    def say(self, message=""):
+        """Print a line, buffered per scenario while scenarios run concurrently"""
+        output = _scenario_output.get()
+        if output is None:
+            print(message)
+        else:
+            output.append(message)
+
+    def log_result(self, test_name, success, response_data=None, error=None):
+        """Log test results"""
+        self.tests_run += 1
+        if success:
+            self.tests_passed += 1
+            self.passed_tests.append(test_name)
+            self.say(f"✅ {test_name}{self.passed_suffix}")
+        else:
+            self.failed_tests.append({
+                "test": test_name,
+                "error": str(error) if error else "Unknown error",
+                "response": response_data
+            })
+            self.say(f"❌ {test_name} - FAILED: {error}")
+
+    def build_request(self, method, endpoint, data=None, token=None, headers=None):
+        """Build an API request with the shared auth header, for callers that need client.send() options"""
+        request_headers = {}
+        if token:
+            request_headers['Authorization'] = f'Bearer {token}'
+        if headers:
+            request_headers.update(headers)
+        return self.client.build_request(method, f"{self.base_url}/{endpoint}", json=data, headers=request_headers)
+
+    async def request(self, method, endpoint, data=None, token=None, headers=None):
+        """Send a request to the API and return the raw response"""
+        return await self.client.send(self.build_request(method, endpoint, data=data, token=token, headers=headers))
+
+    async def run_test(self, test_name, method, endpoint, expected_status, data=None, token=None, headers=None):
+        """Run a single API test"""
+        try:
+            response = await self.request(method, endpoint, data=data, token=token, headers=headers)
+
+            success = response.status_code == expected_status
+            try:
+                response_data = response.json()
+            except ValueError:
+                response_data = response.text
+
+            if success:
+                self.log_result(test_name, True, response_data)
+                return True, response_data
+            else:
+                self.log_result(test_name, False, response_data, f"Expected {expected_status}, got {response.status_code}")
+                return False, response_data
+
+        except Exception as e:
+            self.log_result(test_name, False, None, str(e))
+            return False, {}
+
+    async def authenticate(self, endpoint, data):
+        """POST to auth/login or auth/register without logging a test result.
+
+        Returns (token, user_id, response); token and user_id are None unless the call succeeded.
+        """
+        response = await self.request("POST", endpoint, data=data)
+        if response.status_code == 200:
+            body = response.json()
+            return body['access_token'], body['user']['id'], response
+        return None, None, response
+
+    async def login(self, email, password, test_name="Login"):
+        """Login and return (token, user_id), or (None, None) on failure"""
+        success, response = await self.run_test(test_name, "POST", "auth/login", 200, {"email": email, "password": password})
+        if success and 'access_token' in response:
+            return response['access_token'], response['user']['id']
+        return None, None
+
+    async def register_user(self, name, email=None, password="TestPass123!", test_name="Register User"):
+        """Register a user (unique email by default) and return (token, user_id)"""
+        email = email or f"test_{uuid.uuid4().hex[:8]}@example.com"
+        data = {"email": email, "name": name, "password": password}
+        success, response = await self.run_test(test_name, "POST", "auth/register", 200, data)
+        if success and 'access_token' in response:
+            return response['access_token'], response['user']['id']
+        return None, None
+
+    async def _run_buffered(self, scenario):
+        output = []
+        reset_token = _scenario_output.set(output)
+        try:
+            return await scenario
+        finally:
+            _scenario_output.reset(reset_token)
+            self.say("\n".join(output))
+
+    async def run_scenarios(self, *scenarios):
+        """Run independent scenarios concurrently; each scenario's output is printed as one block"""
+        return await asyncio.gather(*(self._run_buffered(scenario) for scenario in scenarios))
+
+    def print_summary(self, title, width=60):
+        """Print the standard test summary"""
+        print("\n" + "=" * width)
+        print(f"📊 {title}")
+        print("=" * width)
+        print(f"Total Tests: {self.tests_run}")
+        print(f"Passed: {self.tests_passed}")
+        print(f"Failed: {len(self.failed_tests)}")
+        if self.tests_run:
+            print(f"Success Rate: {(self.tests_passed/self.tests_run*100):.1f}%")
+
+        if self.failed_tests:
+            print("\n❌ FAILED TESTS:")
+            for test in self.failed_tests:
+                print(f"  - {test['test']}: {test['error']}")
@@ -1,106 +1,75 @@
 #!/usr/bin/env python3
 
-import requests
+import argparse
+import asyncio
 import sys
 import json
 from datetime import datetime, timedelta
 import uuid
+import gzip
+from api_client import AsyncAPITester, DEFAULT_BASE_URL
 
-class AITravelglobeAPITester:
-    def __init__(self, base_url="https://globetrotter-app-6.preview.emergentagent.com/api"):
-        self.base_url = base_url
-        self.session = requests.Session()
-        self.session.headers.update({'Content-Type': 'application/json'})
-        self.token = None
-        self.user_id = None
-        self.tests_run = 0
-        self.tests_passed = 0
-        self.failed_tests = []
-        self.passed_tests = []
-
-    def log_result(self, test_name, success, response_data=None, error=None):
-        """Log test results"""
-        self.tests_run += 1
-        if success:
-            self.tests_passed += 1
-            self.passed_tests.append(test_name)
-            print(f"✅ {test_name} - PASSED")
-        else:
-            self.failed_tests.append({
-                "test": test_name,
-                "error": str(error) if error else "Unknown error",
-                "response": response_data
-            })
-            print(f"❌ {test_name} - FAILED: {error}")
+# Responses at or above this size must arrive compressed
+COMPRESSION_MIN_BYTES = 1024
 
-    def run_test(self, test_name, method, endpoint, expected_status, data=None, headers=None):
-        """Run a single API test"""
-        url = f"{self.base_url}/{endpoint}"
-        test_headers = self.session.headers.copy()
-        if headers:
-            test_headers.update(headers)
-        if self.token:
-            test_headers['Authorization'] = f'Bearer {self.token}'
-
-        try:
-            if method == 'GET':
-                response = self.session.get(url, headers=test_headers)
-            elif method == 'POST':
-                response = self.session.post(url, json=data, headers=test_headers)
-            elif method == 'PUT':
-                response = self.session.put(url, json=data, headers=test_headers)
-            elif method == 'DELETE':
-                response = self.session.delete(url, headers=test_headers)
-
-            success = response.status_code == expected_status
-            response_data = None
-            try:
-                response_data = response.json()
-            except:
-                response_data = response.text
+# Profile set on the main test user, and on every scenario user so generation sees the same preferences
+TEST_PROFILE = {
+    "age": 30,
+    "gender": "male",
+    "marital_status": "single",
+    "food_preferences": {
+        "diet_type": "vegetarian",
+        "allergies": ["peanuts"],
+        "restrictions": ["no beef"]
+    },
+    "budget_preferences": {
+        "daily_budget_min": 100,
+        "daily_budget_max": 300,
+        "trip_budget_preference": "mid-range"
+    },
+    "travel_interests": ["food", "culture", "nature"],
+    "is_business_traveler": False
+}
 
-            if success:
-                self.log_result(test_name, True, response_data)
-                return True, response_data
-            else:
-                self.log_result(test_name, False, response_data, f"Expected {expected_status}, got {response.status_code}")
-                return False, response_data
-
-        except Exception as e:
-            self.log_result(test_name, False, None, str(e))
-            return False, {}
+class AITravelglobeAPITester(AsyncAPITester):
+    def __init__(self, base_url=DEFAULT_BASE_URL, assert_compression=False):
+        super().__init__(base_url)
+        self.token = None
+        self.user_id = None
+        # Compression middleware is still pending in the backend; until then findings are warnings only
+        self.assert_compression = assert_compression
 
-    def test_health_endpoints(self):
+    async def test_health_endpoints(self):
         """Test basic health endpoints"""
-        print("\n🔍 Testing Health Endpoints...")
+        self.say("\n🔍 Testing Health Endpoints...")
         
         # Test root endpoint
-        self.run_test("Root Endpoint", "GET", "", 200)
+        await self.run_test("Root Endpoint", "GET", "", 200)
         
         # Test health check
-        self.run_test("Health Check", "GET", "health", 200)
+        await self.run_test("Health Check", "GET", "health", 200)
 
-    def test_destinations_endpoint(self):
+    async def test_destinations_endpoint(self):
         """Test destinations endpoint"""
-        print("\n🔍 Testing Destinations...")
+        self.say("\n🔍 Testing Destinations...")
         
-        success, data = self.run_test("Popular Destinations", "GET", "destinations/popular", 200)
+        success, data = await self.run_test("Popular Destinations", "GET", "destinations/popular", 200)
         if success and isinstance(data, list) and len(data) > 0:
-            print(f"   Found {len(data)} destinations")
+            self.say(f"   Found {len(data)} destinations")
         
-    def test_emergency_endpoint(self):
+    async def test_emergency_endpoint(self):
         """Test emergency info endpoint"""
-        print("\n🔍 Testing Emergency Info...")
+        self.say("\n🔍 Testing Emergency Info...")
         
         # Test default emergency info
-        self.run_test("Emergency Info Default", "GET", "emergency/info", 200)
+        await self.run_test("Emergency Info Default", "GET", "emergency/info", 200)
         
         # Test country-specific emergency info
-        self.run_test("Emergency Info France", "GET", "emergency/info?country=france", 200)
+        await self.run_test("Emergency Info France", "GET", "emergency/info?country=france", 200)
 
-    def test_user_registration_login(self):
+    async def test_user_registration_login(self):
         """Test user registration and login"""
-        print("\n🔍 Testing User Authentication...")
+        self.say("\n🔍 Testing User Authentication...")
         
         # Generate unique test user
         test_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -108,69 +77,39 @@ class AITravelglobeAPITester:
         test_name = "Test User"
         
         # Test registration
-        registration_data = {
-            "email": test_email,
-            "name": test_name,
-            "password": test_password
-        }
-        
-        success, response = self.run_test("User Registration", "POST", "auth/register", 200, registration_data)
-        if success and 'access_token' in response:
-            self.token = response['access_token']
-            self.user_id = response['user']['id']
-            print(f"   Registered user: {test_email}")
+        token, user_id = await self.register_user(test_name, test_email, test_password, test_name="User Registration")
+        if token:
+            self.token, self.user_id = token, user_id
+            self.say(f"   Registered user: {test_email}")
         
         # Test login with same credentials
-        login_data = {
-            "email": test_email,
-            "password": test_password
-        }
-        
-        success, response = self.run_test("User Login", "POST", "auth/login", 200, login_data)
-        if success and 'access_token' in response:
-            self.token = response['access_token']
-            print(f"   Logged in user: {test_email}")
+        token, _ = await self.login(test_email, test_password, test_name="User Login")
+        if token:
+            self.token = token
+            self.say(f"   Logged in user: {test_email}")
         
         # Test get current user
         if self.token:
-            self.run_test("Get Current User", "GET", "auth/me", 200)
+            await self.run_test("Get Current User", "GET", "auth/me", 200, token=self.token)
 
-    def test_profile_management(self):
+    async def test_profile_management(self):
         """Test profile management"""
         if not self.token:
-            print("⚠️ Skipping profile tests - no authentication token")
+            self.say("⚠️ Skipping profile tests - no authentication token")
             return
             
-        print("\n🔍 Testing Profile Management...")
+        self.say("\n🔍 Testing Profile Management...")
         
         # Test profile update
-        profile_data = {
-            "age": 30,
-            "gender": "male",
-            "marital_status": "single",
-            "food_preferences": {
-                "diet_type": "vegetarian",
-                "allergies": ["peanuts"],
-                "restrictions": ["no beef"]
-            },
-            "budget_preferences": {
-                "daily_budget_min": 100,
-                "daily_budget_max": 300,
-                "trip_budget_preference": "mid-range"
-            },
-            "travel_interests": ["food", "culture", "nature"],
-            "is_business_traveler": False
-        }
-        
-        self.run_test("Update Profile", "PUT", "auth/profile", 200, profile_data)
+        await self.run_test("Update Profile", "PUT", "auth/profile", 200, TEST_PROFILE, token=self.token)
 
-    def test_itinerary_generation(self):
+    async def test_itinerary_generation(self):
         """Test AI itinerary generation"""
         if not self.token:
-            print("⚠️ Skipping itinerary tests - no authentication token")
+            self.say("⚠️ Skipping itinerary tests - no authentication token")
             return
             
-        print("\n🔍 Testing AI Itinerary Generation...")
+        self.say("\n🔍 Testing AI Itinerary Generation...")
         
         # Test itinerary generation
         trip_data = {
@@ -187,29 +126,30 @@ class AITravelglobeAPITester:
             "is_business_trip": False
         }
         
-        success, response = self.run_test("Generate Itinerary", "POST", "itinerary/generate", 200, trip_data)
+        success, response = await self.run_test("Generate Itinerary", "POST", "itinerary/generate", 200, trip_data, token=self.token)
         
         if success and 'id' in response:
             itinerary_id = response['id']
-            print(f"   Generated itinerary: {itinerary_id}")
+            self.say(f"   Generated itinerary: {itinerary_id}")
             
             # Test get specific itinerary
-            self.run_test("Get Itinerary", "GET", f"itinerary/{itinerary_id}", 200)
+            await self.run_test("Get Itinerary", "GET", f"itinerary/{itinerary_id}", 200, token=self.token)
             
             # Test get my itineraries
-            self.run_test("Get My Itineraries", "GET", "itineraries/my", 200)
+            await self.run_test("Get My Itineraries", "GET", "itineraries/my", 200, token=self.token)
             
             return itinerary_id
         
         return None
 
-    def test_business_trip_generation(self):
+    async def test_business_trip_generation(self, token=None):
         """Test business trip itinerary generation"""
-        if not self.token:
-            print("⚠️ Skipping business trip tests - no authentication token")
+        token = token or self.token
+        if not token:
+            self.say("⚠️ Skipping business trip tests - no authentication token")
             return
             
-        print("\n🔍 Testing Business Trip Generation...")
+        self.say("\n🔍 Testing Business Trip Generation...")
         
         # Test business trip generation
         business_trip_data = {
@@ -231,49 +171,51 @@ class AITravelglobeAPITester:
             "meeting_duration": "2hr"
         }
         
-        success, response = self.run_test("Generate Business Trip", "POST", "itinerary/generate", 200, business_trip_data)
+        success, response = await self.run_test("Generate Business Trip", "POST", "itinerary/generate", 200, business_trip_data, token=token)
         
         if success and 'id' in response:
-            print(f"   Generated business itinerary: {response['id']}")
+            self.say(f"   Generated business itinerary: {response['id']}")
             return response['id']
         
         return None
 
-    def test_albums_management(self):
+    async def test_albums_management(self, token=None):
         """Test trip albums management"""
-        if not self.token:
-            print("⚠️ Skipping albums tests - no authentication token")
+        token = token or self.token
+        if not token:
+            self.say("⚠️ Skipping albums tests - no authentication token")
             return
             
-        print("\n🔍 Testing Albums Management...")
+        self.say("\n🔍 Testing Albums Management...")
         
         # Test create album
-        success, response = self.run_test("Create Album", "POST", "albums?name=Test Album&description=Test Description", 200)
+        success, response = await self.run_test("Create Album", "POST", "albums?name=Test Album&description=Test Description", 200, token=token)
         
         if success and 'id' in response:
             album_id = response['id']
-            print(f"   Created album: {album_id}")
+            self.say(f"   Created album: {album_id}")
             
             # Test get my albums
-            self.run_test("Get My Albums", "GET", "albums", 200)
+            await self.run_test("Get My Albums", "GET", "albums", 200, token=token)
             
             # Test get specific album
-            self.run_test("Get Album", "GET", f"albums/{album_id}", 200)
+            await self.run_test("Get Album", "GET", f"albums/{album_id}", 200, token=token)
             
             # Test update album
-            self.run_test("Update Album", "PUT", f"albums/{album_id}?name=Updated Album&is_public=true", 200)
+            await self.run_test("Update Album", "PUT", f"albums/{album_id}?name=Updated Album&is_public=true", 200, token=token)
             
             return album_id
         
         return None
 
-    def test_community_chat(self):
+    async def test_community_chat(self, token=None):
         """Test community chat functionality"""
-        if not self.token:
-            print("⚠️ Skipping community tests - no authentication token")
+        token = token or self.token
+        if not token:
+            self.say("⚠️ Skipping community tests - no authentication token")
             return
             
-        print("\n🔍 Testing Community Chat...")
+        self.say("\n🔍 Testing Community Chat...")
         
         # Test post message
         message_data = {
@@ -281,22 +223,23 @@ class AITravelglobeAPITester:
             "location_approximate": "Paris, France"
         }
         
-        success, response = self.run_test("Post Community Message", "POST", "community/messages", 200, message_data)
+        success, response = await self.run_test("Post Community Message", "POST", "community/messages", 200, message_data, token=token)
         
         if success and 'id' in response:
             message_id = response['id']
-            print(f"   Posted message: {message_id}")
+            self.say(f"   Posted message: {message_id}")
             
             # Test get messages
-            self.run_test("Get Community Messages", "GET", "community/messages", 200)
+            await self.run_test("Get Community Messages", "GET", "community/messages", 200, token=token)
             
             return message_id
         
         return None
 
-    def test_ai_chat(self):
+    async def test_ai_chat(self, token=None):
         """Test AI chat functionality"""
-        print("\n🔍 Testing AI Chat...")
+        token = token or self.token
+        self.say("\n🔍 Testing AI Chat...")
         
         # Test AI chat
         chat_data = {
@@ -304,60 +247,31 @@ class AITravelglobeAPITester:
             "session_id": str(uuid.uuid4())
         }
         
-        success, response = self.run_test("AI Chat", "POST", "chat", 200, chat_data)
+        success, response = await self.run_test("AI Chat", "POST", "chat", 200, chat_data, token=token)
         
         if success and 'response' in response:
-            print(f"   AI responded with {len(response['response'])} characters")
+            self.say(f"   AI responded with {len(response['response'])} characters")
 
-    def test_delete_chat_history(self):
+    async def test_delete_chat_history(self):
         """Test delete chat history functionality - COMPREHENSIVE TESTING"""
         if not self.token:
-            print("⚠️ Skipping delete chat history tests - no authentication token")
+            self.say("⚠️ Skipping delete chat history tests - no authentication token")
             return
             
-        print("\n🔍 Testing Delete Chat History - COMPREHENSIVE")
-        print("=" * 50)
-        
-        # Store original token to restore later
-        original_token = self.token
-        original_user_id = self.user_id
+        self.say("\n🔍 Testing Delete Chat History - COMPREHENSIVE")
+        self.say("=" * 50)
         
         # ===== SCENARIO 1: Community Message Clear All =====
-        print("\n📋 Scenario 1: Community Message Clear All")
+        self.say("\n📋 Scenario 1: Community Message Clear All")
         
-        # Register a test user specifically for delete testing
-        test_email = "deletetest@test.com"
-        test_password = "DeleteTest123!"
-        test_name = "Delete Test User"
-        
-        registration_data = {
-            "email": test_email,
-            "name": test_name,
-            "password": test_password
-        }
-        
-        success, response = self.run_test("Register Delete Test User", "POST", "auth/register", 200, registration_data)
-        if success and 'access_token' in response:
-            delete_test_token = response['access_token']
-            delete_test_user_id = response['user']['id']
-            self.token = delete_test_token
-            self.user_id = delete_test_user_id
-            print(f"   ✅ Registered delete test user: {test_email}")
+        # Register a test user specifically for delete testing (unique per run)
+        test_email = f"deletetest_{uuid.uuid4().hex[:8]}@test.com"
+        token, user_id = await self.register_user("Delete Test User", test_email, "DeleteTest123!", test_name="Register Delete Test User")
+        if token:
+            self.say(f"   ✅ Registered delete test user: {test_email}")
         else:
-            # Try to login with existing user
-            login_data = {"email": test_email, "password": test_password}
-            success, response = self.run_test("Login Delete Test User", "POST", "auth/login", 200, login_data)
-            if success and 'access_token' in response:
-                delete_test_token = response['access_token']
-                delete_test_user_id = response['user']['id']
-                self.token = delete_test_token
-                self.user_id = delete_test_user_id
-                print(f"   ✅ Logged in delete test user: {test_email}")
-            else:
-                print("   ❌ Failed to create/login delete test user")
-                self.token = original_token
-                self.user_id = original_user_id
-                return
+            self.say("   ❌ Failed to create delete test user")
+            return
         
         # Send 3 community messages
         community_message_ids = []
@@ -367,43 +281,43 @@ class AITravelglobeAPITester:
                 "location_approximate": "Test Location"
             }
             
-            success, response = self.run_test(f"Post Community Message {i+1}", "POST", "community/messages", 200, message_data)
+            success, response = await self.run_test(f"Post Community Message {i+1}", "POST", "community/messages", 200, message_data, token=token)
             if success and 'id' in response:
                 community_message_ids.append(response['id'])
-                print(f"   Posted community message {i+1}: {response['id']}")
+                self.say(f"   Posted community message {i+1}: {response['id']}")
         
         # Verify messages appear in GET /api/community/messages
-        success, messages = self.run_test("Get Community Messages Before Delete", "GET", "community/messages", 200)
+        success, messages = await self.run_test("Get Community Messages Before Delete", "GET", "community/messages", 200, token=token)
         if success and isinstance(messages, list):
-            user_messages_before = [msg for msg in messages if msg.get('user_id') == self.user_id]
-            print(f"   User has {len(user_messages_before)} community messages before deletion")
+            user_messages_before = [msg for msg in messages if msg.get('user_id') == user_id]
+            self.say(f"   User has {len(user_messages_before)} community messages before deletion")
             
             # Call DELETE /api/community/messages/clear-all
-            success, delete_response = self.run_test("Delete All Community Messages", "DELETE", "community/messages/clear-all", 200)
+            success, delete_response = await self.run_test("Delete All Community Messages", "DELETE", "community/messages/clear-all", 200, token=token)
             
             if success and 'deleted_count' in delete_response:
                 deleted_count = delete_response['deleted_count']
-                print(f"   ✅ Deleted {deleted_count} community messages")
+                self.say(f"   ✅ Deleted {deleted_count} community messages")
                 
                 # Verify response includes deleted_count
                 if 'deleted_count' in delete_response and 'message' in delete_response:
-                    print(f"   ✅ Response format correct: {delete_response}")
+                    self.say(f"   ✅ Response format correct: {delete_response}")
                 else:
-                    print(f"   ❌ Response format incorrect: {delete_response}")
+                    self.say(f"   ❌ Response format incorrect: {delete_response}")
                 
                 # Verify messages are gone from GET response
-                success, messages_after = self.run_test("Get Community Messages After Delete", "GET", "community/messages", 200)
+                success, messages_after = await self.run_test("Get Community Messages After Delete", "GET", "community/messages", 200, token=token)
                 if success and isinstance(messages_after, list):
-                    user_messages_after = [msg for msg in messages_after if msg.get('user_id') == self.user_id]
-                    print(f"   User has {len(user_messages_after)} community messages after deletion")
+                    user_messages_after = [msg for msg in messages_after if msg.get('user_id') == user_id]
+                    self.say(f"   User has {len(user_messages_after)} community messages after deletion")
                     
                     if len(user_messages_after) == 0:
-                        print("   ✅ Community messages successfully deleted")
+                        self.say("   ✅ Community messages successfully deleted")
                     else:
-                        print("   ❌ Some community messages still exist after deletion")
+                        self.say("   ❌ Some community messages still exist after deletion")
         
         # ===== SCENARIO 2: Single Message Delete =====
-        print("\n📋 Scenario 2: Single Message Delete")
+        self.say("\n📋 Scenario 2: Single Message Delete")
         
         # Send a new community message
         message_data = {
@@ -411,66 +325,46 @@ class AITravelglobeAPITester:
             "location_approximate": "Test Location"
         }
         
-        success, response = self.run_test("Post Single Community Message", "POST", "community/messages", 200, message_data)
+        success, response = await self.run_test("Post Single Community Message", "POST", "community/messages", 200, message_data, token=token)
         if success and 'id' in response:
             single_message_id = response['id']
-            print(f"   Posted single message: {single_message_id}")
+            self.say(f"   Posted single message: {single_message_id}")
             
             # Call DELETE /api/community/messages/{message_id}
-            success, delete_response = self.run_test("Delete Single Community Message", "DELETE", f"community/messages/{single_message_id}", 200)
+            success, delete_response = await self.run_test("Delete Single Community Message", "DELETE", f"community/messages/{single_message_id}", 200, token=token)
             
             if success:
-                print(f"   ✅ Single message deleted: {delete_response}")
+                self.say(f"   ✅ Single message deleted: {delete_response}")
                 
                 # Verify message is deleted by checking it doesn't appear in GET
-                success, messages = self.run_test("Get Community Messages After Single Delete", "GET", "community/messages", 200)
+                success, messages = await self.run_test("Get Community Messages After Single Delete", "GET", "community/messages", 200, token=token)
                 if success and isinstance(messages, list):
                     deleted_message_exists = any(msg.get('id') == single_message_id for msg in messages)
                     if not deleted_message_exists:
-                        print("   ✅ Single message successfully deleted")
+                        self.say("   ✅ Single message successfully deleted")
                     else:
-                        print("   ❌ Single message still exists after deletion")
+                        self.say("   ❌ Single message still exists after deletion")
         
         # ===== SCENARIO 3: Private Message Testing Setup =====
-        print("\n📋 Scenario 3: Private Message Clear All")
+        self.say("\n📋 Scenario 3: Private Message Clear All")
         
         # Register a second user for private messaging
-        test_email2 = "deletetest2@test.com"
-        test_password2 = "DeleteTest123!"
-        test_name2 = "Delete Test User 2"
-        
-        registration_data2 = {
-            "email": test_email2,
-            "name": test_name2,
-            "password": test_password2
-        }
+        test_email2 = f"deletetest2_{uuid.uuid4().hex[:8]}@test.com"
         
         # Store first user's token
-        user1_token = self.token
-        user1_id = self.user_id
-        
-        success, response = self.run_test("Register Second Delete Test User", "POST", "auth/register", 200, registration_data2)
-        if success and 'access_token' in response:
-            user2_token = response['access_token']
-            user2_id = response['user']['id']
-            print(f"   ✅ Registered second user: {test_email2}")
+        user1_token = token
+        user1_id = user_id
+        
+        user2_token, user2_id = await self.register_user("Delete Test User 2", test_email2, "DeleteTest123!", test_name="Register Second Delete Test User")
+        if user2_token:
+            self.say(f"   ✅ Registered second user: {test_email2}")
         else:
-            # Try to login with existing user
-            login_data2 = {"email": test_email2, "password": test_password2}
-            success, response = self.run_test("Login Second Delete Test User", "POST", "auth/login", 200, login_data2)
-            if success and 'access_token' in response:
-                user2_token = response['access_token']
-                user2_id = response['user']['id']
-                print(f"   ✅ Logged in second user: {test_email2}")
-            else:
-                print("   ❌ Failed to create/login second user - skipping private message tests")
-                self.token = original_token
-                self.user_id = original_user_id
-                return
+            self.say("   ❌ Failed to create second user - skipping private message tests")
+            return
         
         # Send private messages between users
-        self.token = user1_token
-        self.user_id = user1_id
+        token = user1_token
+        user_id = user1_id
         
         # User 1 sends messages to User 2
         private_message_ids = []
@@ -480,14 +374,14 @@ class AITravelglobeAPITester:
                 "content": f"Private message {i+1} from User 1 to User 2"
             }
             
-            success, response = self.run_test(f"Send Private Message {i+1}", "POST", "messages", 200, message_data)
+            success, response = await self.run_test(f"Send Private Message {i+1}", "POST", "messages", 200, message_data, token=token)
             if success and 'id' in response:
                 private_message_ids.append(response['id'])
-                print(f"   User 1 sent private message {i+1}: {response['id']}")
+                self.say(f"   User 1 sent private message {i+1}: {response['id']}")
         
         # User 2 sends messages to User 1
-        self.token = user2_token
-        self.user_id = user2_id
+        token = user2_token
+        user_id = user2_id
         
         for i in range(2):
             message_data = {
@@ -495,26 +389,26 @@ class AITravelglobeAPITester:
                 "content": f"Private message {i+1} from User 2 to User 1"
             }
             
-            success, response = self.run_test(f"Send Private Message Back {i+1}", "POST", "messages", 200, message_data)
+            success, response = await self.run_test(f"Send Private Message Back {i+1}", "POST", "messages", 200, message_data, token=token)
             if success and 'id' in response:
-                print(f"   User 2 sent private message {i+1}: {response['id']}")
+                self.say(f"   User 2 sent private message {i+1}: {response['id']}")
         
         # User 1 calls DELETE /api/messages/clear-all
-        self.token = user1_token
-        self.user_id = user1_id
+        token = user1_token
+        user_id = user1_id
         
-        success, delete_response = self.run_test("User 1 Delete All Private Messages", "DELETE", "messages/clear-all", 200)
+        success, delete_response = await self.run_test("User 1 Delete All Private Messages", "DELETE", "messages/clear-all", 200, token=token)
         if success and 'deleted_count' in delete_response:
             deleted_count = delete_response['deleted_count']
-            print(f"   ✅ User 1 deleted {deleted_count} private messages")
+            self.say(f"   ✅ User 1 deleted {deleted_count} private messages")
             
             # Verify only User 1's sent messages are deleted
-            success, conversations = self.run_test("Get Conversations After Delete", "GET", "messages/conversations", 200)
+            success, conversations = await self.run_test("Get Conversations After Delete", "GET", "messages/conversations", 200, token=token)
             if success:
-                print(f"   Conversations after User 1 delete: {len(conversations) if isinstance(conversations, list) else 'N/A'}")
+                self.say(f"   Conversations after User 1 delete: {len(conversations) if isinstance(conversations, list) else 'N/A'}")
         
         # ===== SCENARIO 4: Clear Specific Conversation =====
-        print("\n📋 Scenario 4: Clear Specific Conversation")
+        self.say("\n📋 Scenario 4: Clear Specific Conversation")
         
         # Send more private messages
         for i in range(2):
@@ -523,253 +417,272 @@ class AITravelglobeAPITester:
                 "content": f"New private message {i+1} from User 1 to User 2"
             }
             
-            success, response = self.run_test(f"Send New Private Message {i+1}", "POST", "messages", 200, message_data)
+            success, response = await self.run_test(f"Send New Private Message {i+1}", "POST", "messages", 200, message_data, token=token)
             if success and 'id' in response:
-                print(f"   User 1 sent new private message {i+1}: {response['id']}")
+                self.say(f"   User 1 sent new private message {i+1}: {response['id']}")
         
         # Call DELETE /api/messages/{partner_id}/clear
-        success, delete_response = self.run_test("Clear Specific Conversation", "DELETE", f"messages/{user2_id}/clear", 200)
+        success, delete_response = await self.run_test("Clear Specific Conversation", "DELETE", f"messages/{user2_id}/clear", 200, token=token)
         if success and 'deleted_count' in delete_response:
             deleted_count = delete_response['deleted_count']
-            print(f"   ✅ Cleared {deleted_count} messages in conversation with User 2")
+            self.say(f"   ✅ Cleared {deleted_count} messages in conversation with User 2")
             
             # Verify only messages in that conversation are deleted
-            success, messages_with_user2 = self.run_test("Get Messages with User 2 After Clear", "GET", f"messages/{user2_id}", 200)
+            success, messages_with_user2 = await self.run_test("Get Messages with User 2 After Clear", "GET", f"messages/{user2_id}", 200, token=token)
             if success and isinstance(messages_with_user2, list):
                 user1_sent_messages = [msg for msg in messages_with_user2 if msg.get('sender_id') == user1_id]
-                print(f"   User 1 has {len(user1_sent_messages)} messages with User 2 after clear")
+                self.say(f"   User 1 has {len(user1_sent_messages)} messages with User 2 after clear")
         
         # ===== Test Unauthorized Requests =====
-        print("\n📋 Testing Unauthorized Requests")
+        self.say("\n📋 Testing Unauthorized Requests")
         
         # Remove token to test unauthorized access
-        self.token = None
+        token = None
         
-        success, response = self.run_test("Unauthorized Community Clear", "DELETE", "community/messages/clear-all", 401)
+        success, response = await self.run_test("Unauthorized Community Clear", "DELETE", "community/messages/clear-all", 401, token=token)
         if success:
-            print("   ✅ Unauthorized community clear properly rejected")
+            self.say("   ✅ Unauthorized community clear properly rejected")
         
-        success, response = self.run_test("Unauthorized Private Clear", "DELETE", "messages/clear-all", 401)
+        success, response = await self.run_test("Unauthorized Private Clear", "DELETE", "messages/clear-all", 401, token=token)
         if success:
-            print("   ✅ Unauthorized private clear properly rejected")
+            self.say("   ✅ Unauthorized private clear properly rejected")
         
-        # Restore original token
-        self.token = original_token
-        self.user_id = original_user_id
+        self.say("\n✅ Delete Chat History Testing Complete")
+        self.say("=" * 50)
+
+    async def test_response_compression(self, itinerary_id=None):
+        """Test gzip compression on heavy endpoints (bytes on the wire); warnings unless assert_compression"""
+        if not self.token:
+            self.say("⚠️ Skipping compression tests - no authentication token")
+            return
+            
+        self.say("\n🔍 Testing Response Compression...")
+        
+        endpoints = ["itineraries/my", "community/messages", "messages/conversations"]
+        if itinerary_id:
+            endpoints.insert(0, f"itinerary/{itinerary_id}")
         
-        print("\n✅ Delete Chat History Testing Complete")
-        print("=" * 50)
+        for endpoint in endpoints:
+            test_name = f"Compressed {endpoint}"
+            request = self.build_request("GET", endpoint, token=self.token, headers={'Accept-Encoding': 'gzip'})
+            
+            try:
+                # Stream so aiter_raw() sees the bytes on the wire, before httpx decodes them
+                response = await self.client.send(request, stream=True)
+                try:
+                    wire_body = b"".join([chunk async for chunk in response.aiter_raw()])
+                finally:
+                    await response.aclose()
+                encoding = response.headers.get('Content-Encoding', 'identity')
+                body = gzip.decompress(wire_body) if encoding == 'gzip' else wire_body
+                self.say(f"   {endpoint}: {len(wire_body)} bytes on wire, {len(body)} bytes JSON ({encoding})")
+                
+                if response.status_code != 200:
+                    error = f"Expected 200, got {response.status_code}"
+                elif len(body) >= COMPRESSION_MIN_BYTES and encoding != 'gzip':
+                    error = f"{len(body)} byte response sent uncompressed"
+                elif encoding == 'gzip' and len(wire_body) >= len(body):
+                    error = f"Compressed body ({len(wire_body)}) not smaller than JSON ({len(body)})"
+                else:
+                    error = None
+            except Exception as e:
+                error = str(e)
+            
+            if self.assert_compression:
+                self.log_result(test_name, error is None, None, error)
+            elif error:
+                self.say(f"⚠️ {test_name} - {error} (not asserted; pass --assert-compression)")
 
-    def test_existing_user_login(self):
+    async def test_existing_user_login(self):
         """Test login with existing test user"""
-        print("\n🔍 Testing Existing User Login...")
+        self.say("\n🔍 Testing Existing User Login...")
         
         # Test login with existing test user
-        login_data = {
-            "email": "chattest@example.com",
-            "password": "test123456"
-        }
-        
-        success, response = self.run_test("Existing User Login", "POST", "auth/login", 200, login_data)
-        if success and 'access_token' in response:
-            self.token = response['access_token']
-            self.user_id = response['user']['id']
-            print(f"   Logged in existing user: chattest@example.com")
+        token, user_id = await self.login("chattest@example.com", "test123456", test_name="Existing User Login")
+        if token:
+            self.token, self.user_id = token, user_id
+            self.say(f"   Logged in existing user: chattest@example.com")
             return True
         else:
-            print("   ⚠️ Existing test user not found, will use newly created user")
+            self.say("   ⚠️ Existing test user not found, will use newly created user")
             return False
 
-    def test_dashboard_theme(self):
+    async def test_dashboard_theme(self):
         """Test dashboard theme endpoint"""
-        print("\n🔍 Testing Dashboard Theme...")
+        self.say("\n🔍 Testing Dashboard Theme...")
         
-        self.run_test("Get Dashboard Theme", "GET", "dashboard/theme", 200)
+        await self.run_test("Get Dashboard Theme", "GET", "dashboard/theme", 200)
 
-    def test_ghost_user_bug_fix(self):
+    async def test_ghost_user_bug_fix(self):
         """Test Ghost User Bug Fix - Critical Priority Test"""
-        print("\n🔍 Testing Ghost User Bug Fix - CRITICAL PRIORITY")
-        print("=" * 50)
-        
-        # Store original token to restore later
-        original_token = self.token
-        original_user_id = self.user_id
+        self.say("\n🔍 Testing Ghost User Bug Fix - CRITICAL PRIORITY")
+        self.say("=" * 50)
         
         # Scenario 1: Basic Online Users Flow
-        print("\n📋 Scenario 1: Basic Online Users Flow")
+        self.say("\n📋 Scenario 1: Basic Online Users Flow")
         
         # Register first test user
-        test_email1 = f"ghosttest1@test.com"
-        test_password1 = "GhostTest123!"
-        test_name1 = "Ghost Test 1"
-        
-        registration_data1 = {
-            "email": test_email1,
-            "name": test_name1,
-            "password": test_password1
-        }
-        
-        success1, response1 = self.run_test("Register Ghost Test User 1", "POST", "auth/register", 200, registration_data1)
-        if not success1:
-            print("❌ Failed to register first test user - aborting ghost user tests")
+        test_email1 = f"ghosttest1_{uuid.uuid4().hex[:8]}@test.com"
+        token1, user_id1 = await self.register_user("Ghost Test 1", test_email1, "GhostTest123!", test_name="Register Ghost Test User 1")
+        if not token1:
+            self.say("❌ Failed to register first test user - aborting ghost user tests")
             return
             
-        token1 = response1.get('access_token')
-        user_id1 = response1['user']['id']
-        print(f"   ✅ Registered User 1: {test_email1} (ID: {user_id1})")
+        self.say(f"   ✅ Registered User 1: {test_email1} (ID: {user_id1})")
         
         # Register second test user
-        test_email2 = f"ghosttest2@test.com"
-        test_password2 = "GhostTest123!"
-        test_name2 = "Ghost Test 2"
-        
-        registration_data2 = {
-            "email": test_email2,
-            "name": test_name2,
-            "password": test_password2
-        }
-        
-        success2, response2 = self.run_test("Register Ghost Test User 2", "POST", "auth/register", 200, registration_data2)
-        if not success2:
-            print("❌ Failed to register second test user - aborting ghost user tests")
+        test_email2 = f"ghosttest2_{uuid.uuid4().hex[:8]}@test.com"
+        token2, user_id2 = await self.register_user("Ghost Test 2", test_email2, "GhostTest123!", test_name="Register Ghost Test User 2")
+        if not token2:
+            self.say("❌ Failed to register second test user - aborting ghost user tests")
             return
             
-        token2 = response2.get('access_token')
-        user_id2 = response2['user']['id']
-        print(f"   ✅ Registered User 2: {test_email2} (ID: {user_id2})")
+        self.say(f"   ✅ Registered User 2: {test_email2} (ID: {user_id2})")
         
         # User 1 calls online-users endpoint (this marks them as online)
-        self.token = token1
-        success, online_users1 = self.run_test("User 1 Get Online Users", "GET", "community/online-users", 200)
+        token = token1
+        success, online_users1 = await self.run_test("User 1 Get Online Users", "GET", "community/online-users", 200, token=token)
         if success:
-            print(f"   User 1 sees {len(online_users1)} online users")
+            self.say(f"   User 1 sees {len(online_users1)} online users")
         
         # User 2 calls online-users endpoint (this marks them as online)
-        self.token = token2
-        success, online_users2 = self.run_test("User 2 Get Online Users", "GET", "community/online-users", 200)
+        token = token2
+        success, online_users2 = await self.run_test("User 2 Get Online Users", "GET", "community/online-users", 200, token=token)
         if success:
-            print(f"   User 2 sees {len(online_users2)} online users")
+            self.say(f"   User 2 sees {len(online_users2)} online users")
             # Check if User 1 is visible to User 2
             user1_visible = any(user.get('id') == user_id1 for user in online_users2)
             if user1_visible:
-                print("   ✅ User 1 is visible to User 2")
+                self.say("   ✅ User 1 is visible to User 2")
             else:
-                print("   ❌ User 1 is NOT visible to User 2")
+                self.say("   ❌ User 1 is NOT visible to User 2")
         
         # Check presence status
-        success, presence_status = self.run_test("Check Presence Status", "GET", "community/presence-status", 200)
+        success, presence_status = await self.run_test("Check Presence Status", "GET", "community/presence-status", 200, token=token)
         if success:
             cache_count = presence_status.get('cache_users_count', 0)
             db_count = presence_status.get('db_users_count', 0)
-            print(f"   Cache has {cache_count} users, DB has {db_count} users")
+            self.say(f"   Cache has {cache_count} users, DB has {db_count} users")
         
         # Scenario 2: Ghost User Prevention
-        print("\n📋 Scenario 2: Ghost User Prevention")
-        print("   Simulating direct database deletion of User 1...")
+        self.say("\n📋 Scenario 2: Ghost User Prevention")
+        self.say("   Simulating direct database deletion of User 1...")
         
         # Use admin endpoint to simulate user deletion (cascade delete)
         # This is safer than direct DB manipulation in a test environment
-        self.token = token1  # Use User 1's token for deletion
+        token = token1  # Use User 1's token for deletion
         
         # First, let's try the admin cleanup endpoint to see current state
-        success, cleanup_result = self.run_test("Admin Cleanup Ghost Users", "POST", "admin/cleanup-ghost-users", 200)
+        success, cleanup_result = await self.run_test("Admin Cleanup Ghost Users", "POST", "admin/cleanup-ghost-users", 200, token=token)
         if success:
-            print(f"   Initial cleanup removed {cleanup_result.get('invalid_removed', 0)} ghost users")
+            self.say(f"   Initial cleanup removed {cleanup_result.get('invalid_removed', 0)} ghost users")
         
         # Now User 2 checks online users - should still see User 1 since both exist
-        self.token = token2
-        success, online_users_before = self.run_test("User 2 Get Online Users Before Deletion", "GET", "community/online-users", 200)
+        token = token2
+        success, online_users_before = await self.run_test("User 2 Get Online Users Before Deletion", "GET", "community/online-users", 200, token=token)
         if success:
             user1_visible_before = any(user.get('id') == user_id1 for user in online_users_before)
-            print(f"   Before deletion: User 1 visible to User 2: {user1_visible_before}")
+            self.say(f"   Before deletion: User 1 visible to User 2: {user1_visible_before}")
         
         # Simulate user deletion by testing the validation logic
         # Since we can't directly delete from MongoDB in this test environment,
         # we'll test the admin endpoints that handle ghost user cleanup
         
         # Test admin reset functionality
-        print("\n📋 Scenario 3: Admin Reset Functionality")
+        self.say("\n📋 Scenario 3: Admin Reset Functionality")
         
         # Test admin reset endpoint
-        self.token = token2  # Use any valid token for admin operations
-        success, reset_result = self.run_test("Admin Reset Online Users", "POST", "admin/reset-online-users", 200)
+        token = token2  # Use any valid token for admin operations
+        success, reset_result = await self.run_test("Admin Reset Online Users", "POST", "admin/reset-online-users", 200, token=token)
         if success:
             cache_cleared = reset_result.get('cache_cleared', 0)
             users_reset = reset_result.get('users_reset', 0)
-            print(f"   Reset cleared {cache_cleared} cache entries and reset {users_reset} users")
+            self.say(f"   Reset cleared {cache_cleared} cache entries and reset {users_reset} users")
         
         # Check presence status after reset
-        success, presence_after_reset = self.run_test("Check Presence Status After Reset", "GET", "community/presence-status", 200)
+        success, presence_after_reset = await self.run_test("Check Presence Status After Reset", "GET", "community/presence-status", 200, token=token)
         if success:
             cache_count_after = presence_after_reset.get('cache_users_count', 0)
             db_count_after = presence_after_reset.get('db_users_count', 0)
-            print(f"   After reset: Cache has {cache_count_after} users, DB has {db_count_after} users")
+            self.say(f"   After reset: Cache has {cache_count_after} users, DB has {db_count_after} users")
         
         # Users should be able to re-add themselves to online list
-        success, online_users_after_reset = self.run_test("User 2 Get Online Users After Reset", "GET", "community/online-users", 200)
+        success, online_users_after_reset = await self.run_test("User 2 Get Online Users After Reset", "GET", "community/online-users", 200, token=token)
         if success:
-            print(f"   After reset: User 2 sees {len(online_users_after_reset)} online users")
+            self.say(f"   After reset: User 2 sees {len(online_users_after_reset)} online users")
         
         # Test the cleanup endpoint again
-        success, final_cleanup = self.run_test("Final Admin Cleanup Ghost Users", "POST", "admin/cleanup-ghost-users", 200)
+        success, final_cleanup = await self.run_test("Final Admin Cleanup Ghost Users", "POST", "admin/cleanup-ghost-users", 200, token=token)
         if success:
             invalid_removed = final_cleanup.get('invalid_removed', 0)
             stale_removed = final_cleanup.get('stale_removed', 0)
-            print(f"   Final cleanup: {invalid_removed} invalid users, {stale_removed} stale users removed")
+            self.say(f"   Final cleanup: {invalid_removed} invalid users, {stale_removed} stale users removed")
         
-        # Restore original token
-        self.token = original_token
-        self.user_id = original_user_id
-        
-        print("\n✅ Ghost User Bug Fix Testing Complete")
-        print("=" * 50)
+        self.say("\n✅ Ghost User Bug Fix Testing Complete")
+        self.say("=" * 50)
+
+    async def test_user_scenarios(self):
+        """Authenticate the main test user, then run the user-scoped scenarios concurrently"""
+        # Try existing user first, then create new if needed
+        existing_user_success = await self.test_existing_user_login()
+        if not existing_user_success:
+            await self.test_user_registration_login()
+        
+        await self.test_profile_management()
+        
+        # Every concurrent scenario except the itinerary one gets its own account,
+        # so no two scenarios read or write the same user's data
+        await self.run_scenarios(
+            self.test_itinerary_and_compression(),
+            self.run_as_new_user("Business Trip", self.test_business_trip_generation),
+            self.run_as_new_user("Albums", self.test_albums_management),
+            self.run_as_new_user("Community Chat", self.test_community_chat),
+            self.run_as_new_user("AI Chat", self.test_ai_chat),
+            self.test_delete_chat_history()
+        )
+
+    async def run_as_new_user(self, label, scenario):
+        """Register a fresh user with the main user's profile and run a token-scoped scenario as that user"""
+        token, _ = await self.register_user(f"{label} Test User", test_name=f"Register {label} User")
+        if not token:
+            self.say(f"⚠️ Skipping {label} tests - could not register a user")
+            return None
+        # Profile setup is covered by "Update Profile"; here it only makes the fresh user match the main one
+        response = await self.request("PUT", "auth/profile", data=TEST_PROFILE, token=token)
+        if response.status_code != 200:
+            self.say(f"⚠️ {label} user profile not set: {response.status_code} - {response.text}")
+        return await scenario(token=token)
+
+    async def test_itinerary_and_compression(self):
+        """Generate an itinerary, then check bytes on the wire for heavy payloads"""
+        itinerary_id = await self.test_itinerary_generation()
+        await self.test_response_compression(itinerary_id)
+
+    async def run_scenarios_concurrently(self):
+        """Run independent scenarios concurrently on one pooled client"""
+        async with self:
+            await self.run_scenarios(
+                # Basic endpoints
+                self.test_health_endpoints(),
+                self.test_destinations_endpoint(),
+                self.test_emergency_endpoint(),
+                self.test_dashboard_theme(),
+                # CRITICAL PRIORITY: Ghost User Bug Fix Testing (uses its own users)
+                self.test_ghost_user_bug_fix(),
+                # Authentication, profile and core functionality
+                self.test_user_scenarios()
+            )
 
     def run_all_tests(self):
-        """Run all tests in sequence"""
+        """Run all tests, independent scenarios concurrently"""
         print("🚀 Starting AITravelglobe API Tests")
         print(f"Testing against: {self.base_url}")
         print("=" * 60)
         
-        # Basic endpoints
-        self.test_health_endpoints()
-        self.test_destinations_endpoint()
-        self.test_emergency_endpoint()
-        self.test_dashboard_theme()
-        
-        # Authentication and user management
-        # Try existing user first, then create new if needed
-        existing_user_success = self.test_existing_user_login()
-        if not existing_user_success:
-            self.test_user_registration_login()
-        
-        self.test_profile_management()
-        
-        # CRITICAL PRIORITY: Ghost User Bug Fix Testing
-        self.test_ghost_user_bug_fix()
-        
-        # Core functionality
-        self.test_itinerary_generation()
-        self.test_business_trip_generation()
-        self.test_albums_management()
-        self.test_community_chat()
-        self.test_ai_chat()
-        
-        # Delete chat history tests
-        self.test_delete_chat_history()
+        asyncio.run(self.run_scenarios_concurrently())
         
         # Print summary
-        print("\n" + "=" * 60)
-        print("📊 TEST SUMMARY")
-        print("=" * 60)
-        print(f"Total Tests: {self.tests_run}")
-        print(f"Passed: {self.tests_passed}")
-        print(f"Failed: {len(self.failed_tests)}")
-        print(f"Success Rate: {(self.tests_passed/self.tests_run*100):.1f}%")
-        
-        if self.failed_tests:
-            print("\n❌ FAILED TESTS:")
-            for test in self.failed_tests:
-                print(f"  - {test['test']}: {test['error']}")
+        self.print_summary("TEST SUMMARY")
         
         if self.passed_tests:
             print(f"\n✅ PASSED TESTS ({len(self.passed_tests)}):")
@@ -779,7 +692,12 @@ class AITravelglobeAPITester:
         return len(self.failed_tests) == 0
 
 def main():
-    tester = AITravelglobeAPITester()
+    parser = argparse.ArgumentParser(description="AITravelglobe API tests")
+    parser.add_argument("--assert-compression", action="store_true",
+                        help="Fail on uncompressed heavy responses (once the backend compression middleware lands)")
+    args = parser.parse_args()
+    
+    tester = AITravelglobeAPITester(assert_compression=args.assert_compression)
     success = tester.run_all_tests()
     return 0 if success else 1
 
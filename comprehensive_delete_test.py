@@ -1,22 +1,21 @@
 #!/usr/bin/env python3
 
-import requests
+import asyncio
 import json
 import uuid
+from api_client import AsyncAPITester, DEFAULT_BASE_URL
 
-class ComprehensiveDeleteChatTester:
-    def __init__(self, base_url="https://globetrotter-app-6.preview.emergentagent.com/api"):
-        self.base_url = base_url
-        self.session = requests.Session()
-        self.session.headers.update({'Content-Type': 'application/json'})
+class ComprehensiveDeleteChatTester(AsyncAPITester):
+    def __init__(self, base_url=DEFAULT_BASE_URL):
+        super().__init__(base_url)
         self.token = None
         self.user_id = None
         self.second_user_id = None
         self.second_token = None
 
-    def create_test_user(self):
+    async def create_test_user(self):
         """Create a second test user for private messaging"""
-        print("👤 Creating second test user...")
+        self.say("👤 Creating second test user...")
         
         test_email = f"testuser_{uuid.uuid4().hex[:8]}@example.com"
         user_data = {
@@ -26,23 +25,20 @@ class ComprehensiveDeleteChatTester:
         }
         
         try:
-            response = self.session.post(f"{self.base_url}/auth/register", json=user_data)
-            if response.status_code == 200:
-                data = response.json()
-                self.second_user_id = data['user']['id']
-                self.second_token = data['access_token']
-                print(f"✅ Created second user: {test_email} (ID: {self.second_user_id})")
+            self.second_token, self.second_user_id, response = await self.authenticate("auth/register", user_data)
+            if self.second_token:
+                self.say(f"✅ Created second user: {test_email} (ID: {self.second_user_id})")
                 return True
             else:
-                print(f"❌ Failed to create second user: {response.status_code} - {response.text}")
+                self.say(f"❌ Failed to create second user: {response.status_code} - {response.text}")
                 return False
         except Exception as e:
-            print(f"❌ Error creating second user: {e}")
+            self.say(f"❌ Error creating second user: {e}")
             return False
 
-    def login_test_user(self):
+    async def login_test_user(self):
         """Login with existing test user"""
-        print("🔐 Logging in with main test user...")
+        self.say("🔐 Logging in with main test user...")
         
         login_data = {
             "email": "chattest@example.com",
@@ -50,22 +46,18 @@ class ComprehensiveDeleteChatTester:
         }
         
         try:
-            response = self.session.post(f"{self.base_url}/auth/login", json=login_data)
-            if response.status_code == 200:
-                data = response.json()
-                self.token = data['access_token']
-                self.user_id = data['user']['id']
-                self.session.headers['Authorization'] = f'Bearer {self.token}'
-                print(f"✅ Logged in successfully as {login_data['email']} (ID: {self.user_id})")
+            self.token, self.user_id, response = await self.authenticate("auth/login", login_data)
+            if self.token:
+                self.say(f"✅ Logged in successfully as {login_data['email']} (ID: {self.user_id})")
                 return True
             else:
-                print(f"❌ Login failed: {response.status_code} - {response.text}")
+                self.say(f"❌ Login failed: {response.status_code} - {response.text}")
                 return False
         except Exception as e:
-            print(f"❌ Login error: {e}")
+            self.say(f"❌ Login error: {e}")
             return False
 
-    def send_private_message(self, recipient_id, content):
+    async def send_private_message(self, recipient_id, content):
         """Send a private message"""
         message_data = {
             "recipient_id": recipient_id,
@@ -73,36 +65,36 @@ class ComprehensiveDeleteChatTester:
         }
         
         try:
-            response = self.session.post(f"{self.base_url}/messages", json=message_data)
+            response = await self.request("POST", "messages", data=message_data, token=self.token)
             if response.status_code == 200:
                 return response.json()
             else:
-                print(f"❌ Failed to send private message: {response.status_code} - {response.text}")
+                self.say(f"❌ Failed to send private message: {response.status_code} - {response.text}")
                 return None
         except Exception as e:
-            print(f"❌ Error sending private message: {e}")
+            self.say(f"❌ Error sending private message: {e}")
             return None
 
-    def test_comprehensive_delete_flow(self):
+    async def test_comprehensive_delete_flow(self):
         """Test comprehensive delete chat history flow"""
-        print("\n🔍 Testing Comprehensive Delete Chat History Flow...")
+        self.say("\n🔍 Testing Comprehensive Delete Chat History Flow...")
         
         # 1. Send multiple private messages to the second user
-        print("📤 Sending private messages...")
+        self.say("📤 Sending private messages...")
         messages_sent = []
         for i in range(3):
             content = f"Test private message {i+1} for deletion testing"
-            message = self.send_private_message(self.second_user_id, content)
+            message = await self.send_private_message(self.second_user_id, content)
             if message:
                 messages_sent.append(message['id'])
-                print(f"✅ Sent private message {i+1}: {message['id']}")
+                self.say(f"✅ Sent private message {i+1}: {message['id']}")
         
         if not messages_sent:
-            print("❌ No private messages sent, cannot test deletion")
+            self.say("❌ No private messages sent, cannot test deletion")
             return False
         
         # 2. Post community messages
-        print("\n📤 Posting community messages...")
+        self.say("\n📤 Posting community messages...")
         community_messages = []
         for i in range(2):
             message_data = {
@@ -111,161 +103,168 @@ class ComprehensiveDeleteChatTester:
             }
             
             try:
-                response = self.session.post(f"{self.base_url}/community/messages", json=message_data)
+                response = await self.request("POST", "community/messages", data=message_data, token=self.token)
                 if response.status_code == 200:
                     msg_id = response.json()['id']
                     community_messages.append(msg_id)
-                    print(f"✅ Posted community message {i+1}: {msg_id}")
+                    self.say(f"✅ Posted community message {i+1}: {msg_id}")
             except Exception as e:
-                print(f"❌ Error posting community message: {e}")
+                self.say(f"❌ Error posting community message: {e}")
         
         # 3. Verify messages exist before deletion
-        print("\n📊 Verifying messages before deletion...")
+        self.say("\n📊 Verifying messages before deletion...")
         
         # Check private messages
         try:
-            response = self.session.get(f"{self.base_url}/messages/{self.second_user_id}")
+            response = await self.request("GET", f"messages/{self.second_user_id}", token=self.token)
             if response.status_code == 200:
                 private_msgs = response.json()
                 user_private_msgs = [msg for msg in private_msgs if msg.get('sender_id') == self.user_id]
-                print(f"📊 Found {len(user_private_msgs)} private messages with second user")
+                self.say(f"📊 Found {len(user_private_msgs)} private messages with second user")
             else:
-                print(f"❌ Failed to get private messages: {response.status_code}")
+                self.say(f"❌ Failed to get private messages: {response.status_code}")
         except Exception as e:
-            print(f"❌ Error getting private messages: {e}")
+            self.say(f"❌ Error getting private messages: {e}")
         
         # Check community messages
         try:
-            response = self.session.get(f"{self.base_url}/community/messages")
+            response = await self.request("GET", "community/messages", token=self.token)
             if response.status_code == 200:
                 all_community_msgs = response.json()
                 user_community_msgs = [msg for msg in all_community_msgs if msg.get('user_id') == self.user_id]
-                print(f"📊 Found {len(user_community_msgs)} community messages from user")
+                self.say(f"📊 Found {len(user_community_msgs)} community messages from user")
             else:
-                print(f"❌ Failed to get community messages: {response.status_code}")
+                self.say(f"❌ Failed to get community messages: {response.status_code}")
         except Exception as e:
-            print(f"❌ Error getting community messages: {e}")
+            self.say(f"❌ Error getting community messages: {e}")
         
         # 4. Test specific conversation deletion
-        print("\n🗑️ Testing specific conversation deletion...")
+        self.say("\n🗑️ Testing specific conversation deletion...")
         try:
-            response = self.session.delete(f"{self.base_url}/messages/{self.second_user_id}/clear")
+            response = await self.request("DELETE", f"messages/{self.second_user_id}/clear", token=self.token)
             if response.status_code == 200:
                 result = response.json()
-                print(f"✅ DELETE /api/messages/{{partner_id}}/clear - Deleted {result['deleted_count']} messages")
-                print(f"   Response: {result['message']}")
+                self.say(f"✅ DELETE /api/messages/{{partner_id}}/clear - Deleted {result['deleted_count']} messages")
+                self.say(f"   Response: {result['message']}")
                 
                 # Verify specific conversation is cleared
-                response = self.session.get(f"{self.base_url}/messages/{self.second_user_id}")
+                response = await self.request("GET", f"messages/{self.second_user_id}", token=self.token)
                 if response.status_code == 200:
                     remaining_msgs = response.json()
                     user_msgs_after = [msg for msg in remaining_msgs if msg.get('sender_id') == self.user_id]
-                    print(f"📊 {len(user_msgs_after)} messages remaining in conversation after deletion")
+                    self.say(f"📊 {len(user_msgs_after)} messages remaining in conversation after deletion")
                     
                     if len(user_msgs_after) == 0:
-                        print("✅ Specific conversation deletion verified")
+                        self.say("✅ Specific conversation deletion verified")
                     else:
-                        print("❌ Some messages still exist in conversation")
+                        self.say("❌ Some messages still exist in conversation")
             else:
-                print(f"❌ Specific conversation deletion failed: {response.status_code}")
+                self.say(f"❌ Specific conversation deletion failed: {response.status_code}")
                 return False
         except Exception as e:
-            print(f"❌ Error in specific conversation deletion: {e}")
+            self.say(f"❌ Error in specific conversation deletion: {e}")
             return False
         
         # 5. Send more messages and test clear all private messages
-        print("\n📤 Sending more private messages for clear-all test...")
+        self.say("\n📤 Sending more private messages for clear-all test...")
         for i in range(2):
             content = f"Additional test message {i+1} for clear-all testing"
-            message = self.send_private_message(self.second_user_id, content)
+            message = await self.send_private_message(self.second_user_id, content)
             if message:
-                print(f"✅ Sent additional message {i+1}: {message['id']}")
+                self.say(f"✅ Sent additional message {i+1}: {message['id']}")
         
         # 6. Test clear all private messages
-        print("\n🗑️ Testing clear all private messages...")
+        self.say("\n🗑️ Testing clear all private messages...")
         try:
-            response = self.session.delete(f"{self.base_url}/messages/clear-all")
+            response = await self.request("DELETE", "messages/clear-all", token=self.token)
             if response.status_code == 200:
                 result = response.json()
-                print(f"✅ DELETE /api/messages/clear-all - Deleted {result['deleted_count']} messages")
-                print(f"   Response: {result['message']}")
+                self.say(f"✅ DELETE /api/messages/clear-all - Deleted {result['deleted_count']} messages")
+                self.say(f"   Response: {result['message']}")
             else:
-                print(f"❌ Clear all private messages failed: {response.status_code}")
+                self.say(f"❌ Clear all private messages failed: {response.status_code}")
                 return False
         except Exception as e:
-            print(f"❌ Error in clear all private messages: {e}")
+            self.say(f"❌ Error in clear all private messages: {e}")
             return False
         
         # 7. Test clear all community messages
-        print("\n🗑️ Testing clear all community messages...")
+        self.say("\n🗑️ Testing clear all community messages...")
         try:
-            response = self.session.delete(f"{self.base_url}/community/messages/clear-all")
+            response = await self.request("DELETE", "community/messages/clear-all", token=self.token)
             if response.status_code == 200:
                 result = response.json()
-                print(f"✅ DELETE /api/community/messages/clear-all - Deleted {result['deleted_count']} messages")
-                print(f"   Response: {result['message']}")
+                self.say(f"✅ DELETE /api/community/messages/clear-all - Deleted {result['deleted_count']} messages")
+                self.say(f"   Response: {result['message']}")
             else:
-                print(f"❌ Clear all community messages failed: {response.status_code}")
+                self.say(f"❌ Clear all community messages failed: {response.status_code}")
                 return False
         except Exception as e:
-            print(f"❌ Error in clear all community messages: {e}")
+            self.say(f"❌ Error in clear all community messages: {e}")
             return False
         
         # 8. Final verification - all user messages should be gone
-        print("\n📊 Final verification...")
+        self.say("\n📊 Final verification...")
         
         # Check private messages
         try:
-            response = self.session.get(f"{self.base_url}/messages/{self.second_user_id}")
+            response = await self.request("GET", f"messages/{self.second_user_id}", token=self.token)
             if response.status_code == 200:
                 final_private_msgs = response.json()
                 user_final_private = [msg for msg in final_private_msgs if msg.get('sender_id') == self.user_id]
-                print(f"📊 Final private messages count: {len(user_final_private)}")
+                self.say(f"📊 Final private messages count: {len(user_final_private)}")
                 
                 if len(user_final_private) == 0:
-                    print("✅ All private messages successfully deleted")
+                    self.say("✅ All private messages successfully deleted")
                 else:
-                    print("❌ Some private messages still exist")
+                    self.say("❌ Some private messages still exist")
                     return False
         except Exception as e:
-            print(f"❌ Error in final private message check: {e}")
+            self.say(f"❌ Error in final private message check: {e}")
         
         # Check community messages
         try:
-            response = self.session.get(f"{self.base_url}/community/messages")
+            response = await self.request("GET", "community/messages", token=self.token)
             if response.status_code == 200:
                 final_community_msgs = response.json()
                 user_final_community = [msg for msg in final_community_msgs if msg.get('user_id') == self.user_id]
-                print(f"📊 Final community messages count: {len(user_final_community)}")
+                self.say(f"📊 Final community messages count: {len(user_final_community)}")
                 
                 if len(user_final_community) == 0:
-                    print("✅ All community messages successfully deleted")
+                    self.say("✅ All community messages successfully deleted")
                     return True
                 else:
-                    print("❌ Some community messages still exist")
+                    self.say("❌ Some community messages still exist")
                     return False
         except Exception as e:
-            print(f"❌ Error in final community message check: {e}")
+            self.say(f"❌ Error in final community message check: {e}")
             return False
 
+    async def run_delete_flow(self):
+        """Set up both users, then run the delete flow on a pooled client"""
+        async with self:
+            # Setup
+            if not await self.login_test_user():
+                print("❌ Cannot proceed without main user authentication")
+                return None
+            
+            if not await self.create_test_user():
+                print("❌ Cannot proceed without second user")
+                return None
+            
+            # Run comprehensive test
+            return await self.test_comprehensive_delete_flow()
+
     def run_tests(self):
         """Run comprehensive delete chat history tests"""
         print("🚀 Starting Comprehensive Delete Chat History Tests")
         print(f"Testing against: {self.base_url}")
         print("=" * 70)
         
-        # Setup
-        if not self.login_test_user():
-            print("❌ Cannot proceed without main user authentication")
+        success = asyncio.run(self.run_delete_flow())
+        if success is None:
             return False
         
-        if not self.create_test_user():
-            print("❌ Cannot proceed without second user")
-            return False
-        
-        # Run comprehensive test
-        success = self.test_comprehensive_delete_flow()
-        
         print("\n" + "=" * 70)
         print("📊 COMPREHENSIVE DELETE CHAT HISTORY TEST SUMMARY")
         print("=" * 70)
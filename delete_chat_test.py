@@ -1,20 +1,19 @@
 #!/usr/bin/env python3
 
-import requests
+import asyncio
 import json
 import uuid
+from api_client import AsyncAPITester, DEFAULT_BASE_URL
 
-class DeleteChatHistoryTester:
-    def __init__(self, base_url="https://globetrotter-app-6.preview.emergentagent.com/api"):
-        self.base_url = base_url
-        self.session = requests.Session()
-        self.session.headers.update({'Content-Type': 'application/json'})
+class DeleteChatHistoryTester(AsyncAPITester):
+    def __init__(self, base_url=DEFAULT_BASE_URL):
+        super().__init__(base_url)
         self.token = None
         self.user_id = None
 
-    def login_test_user(self):
+    async def login_test_user(self):
         """Login with existing test user"""
-        print("🔐 Logging in with test user...")
+        self.say("🔐 Logging in with test user...")
         
         login_data = {
             "email": "chattest@example.com",
@@ -22,24 +21,20 @@ class DeleteChatHistoryTester:
         }
         
         try:
-            response = self.session.post(f"{self.base_url}/auth/login", json=login_data)
-            if response.status_code == 200:
-                data = response.json()
-                self.token = data['access_token']
-                self.user_id = data['user']['id']
-                self.session.headers['Authorization'] = f'Bearer {self.token}'
-                print(f"✅ Logged in successfully as {login_data['email']}")
+            self.token, self.user_id, response = await self.authenticate("auth/login", login_data)
+            if self.token:
+                self.say(f"✅ Logged in successfully as {login_data['email']}")
                 return True
             else:
-                print(f"❌ Login failed: {response.status_code} - {response.text}")
+                self.say(f"❌ Login failed: {response.status_code} - {response.text}")
                 return False
         except Exception as e:
-            print(f"❌ Login error: {e}")
+            self.say(f"❌ Login error: {e}")
             return False
 
-    def test_community_message_deletion(self):
+    async def test_community_message_deletion(self):
         """Test community message deletion flow"""
-        print("\n🔍 Testing Community Message Deletion...")
+        self.say("\n🔍 Testing Community Message Deletion...")
         
         # 1. Post a community message
         message_data = {
@@ -48,118 +43,139 @@ class DeleteChatHistoryTester:
         }
         
         try:
-            response = self.session.post(f"{self.base_url}/community/messages", json=message_data)
+            response = await self.request("POST", "community/messages", data=message_data, token=self.token)
             if response.status_code == 200:
                 message_id = response.json()['id']
-                print(f"✅ Posted community message: {message_id}")
+                self.say(f"✅ Posted community message: {message_id}")
                 
                 # 2. Get messages to verify it exists
-                response = self.session.get(f"{self.base_url}/community/messages")
+                response = await self.request("GET", "community/messages", token=self.token)
                 if response.status_code == 200:
                     messages = response.json()
                     user_messages_before = [msg for msg in messages if msg.get('user_id') == self.user_id]
-                    print(f"📊 User has {len(user_messages_before)} community messages before deletion")
+                    self.say(f"📊 User has {len(user_messages_before)} community messages before deletion")
                     
                     # 3. Delete all community messages
-                    response = self.session.delete(f"{self.base_url}/community/messages/clear-all")
+                    response = await self.request("DELETE", "community/messages/clear-all", token=self.token)
                     if response.status_code == 200:
                         delete_result = response.json()
-                        print(f"✅ DELETE /api/community/messages/clear-all - Deleted {delete_result['deleted_count']} messages")
-                        print(f"   Response: {delete_result['message']}")
+                        self.say(f"✅ DELETE /api/community/messages/clear-all - Deleted {delete_result['deleted_count']} messages")
+                        self.say(f"   Response: {delete_result['message']}")
                         
                         # 4. Verify messages are deleted
-                        response = self.session.get(f"{self.base_url}/community/messages")
+                        response = await self.request("GET", "community/messages", token=self.token)
                         if response.status_code == 200:
                             messages_after = response.json()
                             user_messages_after = [msg for msg in messages_after if msg.get('user_id') == self.user_id]
-                            print(f"📊 User has {len(user_messages_after)} community messages after deletion")
+                            self.say(f"📊 User has {len(user_messages_after)} community messages after deletion")
                             
                             if len(user_messages_after) == 0:
-                                print("✅ Community message deletion verified - all user messages removed")
+                                self.say("✅ Community message deletion verified - all user messages removed")
                                 return True
                             else:
-                                print("❌ Some messages still exist after deletion")
+                                self.say("❌ Some messages still exist after deletion")
                                 return False
                     else:
-                        print(f"❌ Delete failed: {response.status_code} - {response.text}")
+                        self.say(f"❌ Delete failed: {response.status_code} - {response.text}")
                         return False
                 else:
-                    print(f"❌ Failed to get messages after posting: {response.status_code}")
+                    self.say(f"❌ Failed to get messages after posting: {response.status_code}")
                     return False
             else:
-                print(f"❌ Failed to post message: {response.status_code} - {response.text}")
+                self.say(f"❌ Failed to post message: {response.status_code} - {response.text}")
                 return False
         except Exception as e:
-            print(f"❌ Community message deletion test error: {e}")
+            self.say(f"❌ Community message deletion test error: {e}")
             return False
 
-    def test_private_message_deletion(self):
+    async def test_private_message_deletion(self):
         """Test private message deletion endpoints"""
-        print("\n🔍 Testing Private Message Deletion...")
+        self.say("\n🔍 Testing Private Message Deletion...")
+        
+        # Own account, so clearing private messages cannot race the community scenario's user
+        registration_data = {
+            "email": f"privatedelete_{uuid.uuid4().hex[:8]}@example.com",
+            "name": "Private Delete Test User",
+            "password": "TestPass123!"
+        }
         
         try:
+            token, _, response = await self.authenticate("auth/register", registration_data)
+            if not token:
+                self.say(f"❌ Private delete test user registration failed: {response.status_code} - {response.text}")
+                return False
+            
             # Test delete all private messages
-            response = self.session.delete(f"{self.base_url}/messages/clear-all")
+            response = await self.request("DELETE", "messages/clear-all", token=token)
             if response.status_code == 200:
                 result = response.json()
-                print(f"✅ DELETE /api/messages/clear-all - Deleted {result['deleted_count']} messages")
-                print(f"   Response: {result['message']}")
+                self.say(f"✅ DELETE /api/messages/clear-all - Deleted {result['deleted_count']} messages")
+                self.say(f"   Response: {result['message']}")
             else:
-                print(f"❌ Delete all private messages failed: {response.status_code} - {response.text}")
+                self.say(f"❌ Delete all private messages failed: {response.status_code} - {response.text}")
                 return False
             
             # Test delete messages with specific partner
             dummy_partner_id = str(uuid.uuid4())
-            response = self.session.delete(f"{self.base_url}/messages/{dummy_partner_id}/clear")
+            response = await self.request("DELETE", f"messages/{dummy_partner_id}/clear", token=token)
             if response.status_code == 200:
                 result = response.json()
-                print(f"✅ DELETE /api/messages/{{partner_id}}/clear - Deleted {result['deleted_count']} messages")
-                print(f"   Response: {result['message']}")
+                self.say(f"✅ DELETE /api/messages/{{partner_id}}/clear - Deleted {result['deleted_count']} messages")
+                self.say(f"   Response: {result['message']}")
                 return True
             else:
-                print(f"❌ Delete partner messages failed: {response.status_code} - {response.text}")
+                self.say(f"❌ Delete partner messages failed: {response.status_code} - {response.text}")
                 return False
                 
         except Exception as e:
-            print(f"❌ Private message deletion test error: {e}")
+            self.say(f"❌ Private message deletion test error: {e}")
             return False
 
-    def test_authentication_required(self):
+    async def test_authentication_required(self):
         """Test that endpoints require authentication"""
-        print("\n🔍 Testing Authentication Requirements...")
-        
-        # Remove auth header temporarily
-        original_auth = self.session.headers.get('Authorization')
-        if 'Authorization' in self.session.headers:
-            del self.session.headers['Authorization']
+        self.say("\n🔍 Testing Authentication Requirements...")
         
+        # Send requests without a token
         try:
             # Test community messages clear without auth
-            response = self.session.delete(f"{self.base_url}/community/messages/clear-all")
+            response = await self.request("DELETE", "community/messages/clear-all")
             if response.status_code == 401:
-                print("✅ DELETE /api/community/messages/clear-all requires authentication")
+                self.say("✅ DELETE /api/community/messages/clear-all requires authentication")
             else:
-                print(f"❌ Expected 401, got {response.status_code}")
+                self.say(f"❌ Expected 401, got {response.status_code}")
             
             # Test private messages clear without auth
-            response = self.session.delete(f"{self.base_url}/messages/clear-all")
+            response = await self.request("DELETE", "messages/clear-all")
             if response.status_code == 401:
-                print("✅ DELETE /api/messages/clear-all requires authentication")
+                self.say("✅ DELETE /api/messages/clear-all requires authentication")
             else:
-                print(f"❌ Expected 401, got {response.status_code}")
+                self.say(f"❌ Expected 401, got {response.status_code}")
             
             # Test partner messages clear without auth
             dummy_partner_id = str(uuid.uuid4())
-            response = self.session.delete(f"{self.base_url}/messages/{dummy_partner_id}/clear")
+            response = await self.request("DELETE", f"messages/{dummy_partner_id}/clear")
             if response.status_code == 401:
-                print("✅ DELETE /api/messages/{partner_id}/clear requires authentication")
+                self.say("✅ DELETE /api/messages/{partner_id}/clear requires authentication")
             else:
-                print(f"❌ Expected 401, got {response.status_code}")
+                self.say(f"❌ Expected 401, got {response.status_code}")
                 
-        finally:
-            # Restore auth header
-            if original_auth:
-                self.session.headers['Authorization'] = original_auth
+        except Exception as e:
+            self.say(f"❌ Authentication requirements test error: {e}")
+
+    async def run_scenarios_concurrently(self):
+        """Login, then run the independent delete scenarios concurrently"""
+        async with self:
+            # Login first
+            if not await self.login_test_user():
+                return None
+            
+            # Authentication requirements, community and private message deletion
+            _, community_success, private_success = await self.run_scenarios(
+                self.test_authentication_required(),
+                self.test_community_message_deletion(),
+                self.test_private_message_deletion()
+            )
+            return community_success, private_success
 
     def run_tests(self):
         """Run all delete chat history tests"""
@@ -167,19 +183,11 @@ class DeleteChatHistoryTester:
         print(f"Testing against: {self.base_url}")
         print("=" * 60)
         
-        # Login first
-        if not self.login_test_user():
+        results = asyncio.run(self.run_scenarios_concurrently())
+        if results is None:
             print("❌ Cannot proceed without authentication")
             return False
-        
-        # Test authentication requirements
-        self.test_authentication_required()
-        
-        # Test community message deletion
-        community_success = self.test_community_message_deletion()
-        
-        # Test private message deletion
-        private_success = self.test_private_message_deletion()
+        community_success, private_success = results
         
         print("\n" + "=" * 60)
         print("📊 DELETE CHAT HISTORY TEST SUMMARY")
@@ -1,188 +1,366 @@
 #!/usr/bin/env python3
 
-import requests
+import argparse
+import asyncio
+import os
+import random
 import sys
 import json
+import time
 from datetime import datetime, timedelta
 import uuid
+from api_client import AsyncAPITester, DEFAULT_BASE_URL
 
-class GhostUserBugFixTester:
-    def __init__(self, base_url="https://globetrotter-app-6.preview.emergentagent.com/api"):
-        self.base_url = base_url
-        self.session = requests.Session()
-        self.session.headers.update({'Content-Type': 'application/json'})
-        self.tests_run = 0
-        self.tests_passed = 0
-        self.failed_tests = []
-
-    def log_result(self, test_name, success, response_data=None, error=None):
-        """Log test results"""
-        self.tests_run += 1
-        if success:
-            self.tests_passed += 1
-            print(f"✅ {test_name}")
-        else:
-            self.failed_tests.append({
-                "test": test_name,
-                "error": str(error) if error else "Unknown error",
-                "response": response_data
-            })
-            print(f"❌ {test_name} - FAILED: {error}")
-
-    def run_test(self, test_name, method, endpoint, expected_status, data=None, token=None):
-        """Run a single API test"""
-        url = f"{self.base_url}/{endpoint}"
-        headers = self.session.headers.copy()
-        if token:
-            headers['Authorization'] = f'Bearer {token}'
+# Seconds between online-users calls for an active soak user
+SOAK_HEARTBEAT_INTERVAL = 15
 
-        try:
-            if method == 'GET':
-                response = self.session.get(url, headers=headers)
-            elif method == 'POST':
-                response = self.session.post(url, json=data, headers=headers)
+# Seconds a deleted user is still watched for reappearing online before it is forgotten
+SOAK_DELETED_RETENTION = 900
 
-            success = response.status_code == expected_status
-            response_data = None
-            try:
-                response_data = response.json()
-            except:
-                response_data = response.text
+# Successful samples needed in the steady-state half of the run for its checks to mean anything
+SOAK_MIN_STEADY_SAMPLES = 2
 
-            if success:
-                self.log_result(test_name, True, response_data)
-                return True, response_data
-            else:
-                self.log_result(test_name, False, response_data, f"Expected {expected_status}, got {response.status_code}")
-                return False, response_data
 
-        except Exception as e:
-            self.log_result(test_name, False, None, str(e))
-            return False, {}
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers (0 for an empty list)"""
+    if not values:
+        return 0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def slope_per_hour(points):
+    """Least-squares slope of (seconds, value) points, per hour (0 for fewer than two points)"""
+    if len(points) < 2:
+        return 0
+    mean_t = sum(t for t, _ in points) / len(points)
+    mean_v = sum(v for _, v in points) / len(points)
+    variance = sum((t - mean_t) ** 2 for t, _ in points) or 1
+    return sum((t - mean_t) * (v - mean_v) for t, v in points) / variance * 3600
+
 
-    def test_ghost_user_bug_fix(self):
+class GhostUserBugFixTester(AsyncAPITester):
+    passed_suffix = ""
+
+    async def test_ghost_user_bug_fix(self):
         """Test Ghost User Bug Fix - Complete Scenarios"""
-        print("🔍 GHOST USER BUG FIX TESTING")
-        print("=" * 60)
+        self.say("🔍 GHOST USER BUG FIX TESTING")
+        self.say("=" * 60)
         
         # Scenario 1: Register test users
-        print("\n📋 Scenario 1: Basic Online Users Flow")
+        self.say("\n📋 Scenario 1: Basic Online Users Flow")
         
         # Register User 1
         test_email1 = f"ghosttest1_{uuid.uuid4().hex[:8]}@test.com"
-        registration_data1 = {
-            "email": test_email1,
-            "name": "Ghost Test 1",
-            "password": "GhostTest123!"
-        }
-        
-        success1, response1 = self.run_test("Register User 1", "POST", "auth/register", 200, registration_data1)
-        if not success1:
-            print("❌ Cannot proceed without User 1")
+        token1, user_id1 = await self.register_user("Ghost Test 1", test_email1, "GhostTest123!", test_name="Register User 1")
+        if not token1:
+            self.say("❌ Cannot proceed without User 1")
             return False
             
-        token1 = response1.get('access_token')
-        user_id1 = response1['user']['id']
-        print(f"   User 1 ID: {user_id1}")
+        self.say(f"   User 1 ID: {user_id1}")
         
         # Register User 2
         test_email2 = f"ghosttest2_{uuid.uuid4().hex[:8]}@test.com"
-        registration_data2 = {
-            "email": test_email2,
-            "name": "Ghost Test 2", 
-            "password": "GhostTest123!"
-        }
-        
-        success2, response2 = self.run_test("Register User 2", "POST", "auth/register", 200, registration_data2)
-        if not success2:
-            print("❌ Cannot proceed without User 2")
+        token2, user_id2 = await self.register_user("Ghost Test 2", test_email2, "GhostTest123!", test_name="Register User 2")
+        if not token2:
+            self.say("❌ Cannot proceed without User 2")
             return False
             
-        token2 = response2.get('access_token')
-        user_id2 = response2['user']['id']
-        print(f"   User 2 ID: {user_id2}")
+        self.say(f"   User 2 ID: {user_id2}")
         
         # User 1 gets online users (marks self as online)
-        success, online_users1 = self.run_test("User 1 Get Online Users", "GET", "community/online-users", 200, token=token1)
+        success, online_users1 = await self.run_test("User 1 Get Online Users", "GET", "community/online-users", 200, token=token1)
         if success:
-            print(f"   User 1 sees {len(online_users1)} online users")
+            self.say(f"   User 1 sees {len(online_users1)} online users")
         
         # User 2 gets online users (marks self as online)
-        success, online_users2 = self.run_test("User 2 Get Online Users", "GET", "community/online-users", 200, token=token2)
+        success, online_users2 = await self.run_test("User 2 Get Online Users", "GET", "community/online-users", 200, token=token2)
         if success:
-            print(f"   User 2 sees {len(online_users2)} online users")
+            self.say(f"   User 2 sees {len(online_users2)} online users")
             user1_visible = any(user.get('id') == user_id1 for user in online_users2)
-            print(f"   User 1 visible to User 2: {user1_visible}")
+            self.say(f"   User 1 visible to User 2: {user1_visible}")
         
         # Check presence status
-        success, presence = self.run_test("Check Presence Status", "GET", "community/presence-status", 200, token=token2)
+        success, presence = await self.run_test("Check Presence Status", "GET", "community/presence-status", 200, token=token2)
         if success:
             cache_count = presence.get('cache_users_count', 0)
             db_count = presence.get('db_users_count', 0)
-            print(f"   Cache: {cache_count} users, DB: {db_count} users")
+            self.say(f"   Cache: {cache_count} users, DB: {db_count} users")
         
         # Scenario 2: Test admin cleanup functionality
-        print("\n📋 Scenario 2: Admin Cleanup Functionality")
+        self.say("\n📋 Scenario 2: Admin Cleanup Functionality")
         
         # Test cleanup ghost users
-        success, cleanup1 = self.run_test("Admin Cleanup Ghost Users", "POST", "admin/cleanup-ghost-users", 200, token=token1)
+        success, cleanup1 = await self.run_test("Admin Cleanup Ghost Users", "POST", "admin/cleanup-ghost-users", 200, token=token1)
         if success:
             invalid_removed = cleanup1.get('invalid_removed', 0)
             stale_removed = cleanup1.get('stale_removed', 0)
-            print(f"   Cleanup: {invalid_removed} invalid, {stale_removed} stale users removed")
+            self.say(f"   Cleanup: {invalid_removed} invalid, {stale_removed} stale users removed")
         
         # Scenario 3: Test admin reset functionality
-        print("\n📋 Scenario 3: Admin Reset Functionality")
+        self.say("\n📋 Scenario 3: Admin Reset Functionality")
         
         # Test admin reset
-        success, reset_result = self.run_test("Admin Reset Online Users", "POST", "admin/reset-online-users", 200, token=token2)
+        success, reset_result = await self.run_test("Admin Reset Online Users", "POST", "admin/reset-online-users", 200, token=token2)
         if success:
             cache_cleared = reset_result.get('cache_cleared', 0)
             users_reset = reset_result.get('users_reset', 0)
-            print(f"   Reset: {cache_cleared} cache cleared, {users_reset} users reset")
+            self.say(f"   Reset: {cache_cleared} cache cleared, {users_reset} users reset")
         
         # Check presence after reset
-        success, presence_after = self.run_test("Presence Status After Reset", "GET", "community/presence-status", 200, token=token1)
+        success, presence_after = await self.run_test("Presence Status After Reset", "GET", "community/presence-status", 200, token=token1)
         if success:
             cache_count_after = presence_after.get('cache_users_count', 0)
             db_count_after = presence_after.get('db_users_count', 0)
-            print(f"   After reset - Cache: {cache_count_after} users, DB: {db_count_after} users")
+            self.say(f"   After reset - Cache: {cache_count_after} users, DB: {db_count_after} users")
         
         # Users can re-add themselves
-        success, online_after_reset = self.run_test("User 2 Online After Reset", "GET", "community/online-users", 200, token=token2)
+        success, online_after_reset = await self.run_test("User 2 Online After Reset", "GET", "community/online-users", 200, token=token2)
         if success:
-            print(f"   User 2 sees {len(online_after_reset)} users after reset")
+            self.say(f"   User 2 sees {len(online_after_reset)} users after reset")
         
         # Final cleanup test
-        success, final_cleanup = self.run_test("Final Cleanup Test", "POST", "admin/cleanup-ghost-users", 200, token=token1)
+        success, final_cleanup = await self.run_test("Final Cleanup Test", "POST", "admin/cleanup-ghost-users", 200, token=token1)
         if success:
             final_invalid = final_cleanup.get('invalid_removed', 0)
             final_stale = final_cleanup.get('stale_removed', 0)
-            print(f"   Final cleanup: {final_invalid} invalid, {final_stale} stale users")
+            self.say(f"   Final cleanup: {final_invalid} invalid, {final_stale} stale users")
         
         return True
 
+    async def run_ghost_scenario(self):
+        """Run the ghost user scenario on a pooled client"""
+        async with self:
+            return await self.test_ghost_user_bug_fix()
+
+    async def pause(self, seconds):
+        """Sleep, waking early when the soak is stopping"""
+        try:
+            await asyncio.wait_for(self.soak_stop.wait(), seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    def delete_user_from_db(self, user_id):
+        """Delete a user the way an account removal would, bypassing presence cleanup; False if the user was not found"""
+        result = self.db.users.delete_one({"id": user_id})
+        self.db.user_sessions.delete_many({"user_id": user_id})
+        return result.deleted_count == 1
+
+    async def soak_user_lifecycle(self, index, active_range, idle_range):
+        """One simulated user: register, heartbeat, go idle, then get deleted"""
+        try:
+            await self.soak_user_phases(index, active_range, idle_range)
+        finally:
+            self.soak["population"] -= 1
+
+    async def soak_user_phases(self, index, active_range, idle_range):
+        registration_data = {
+            "email": f"soak_{uuid.uuid4().hex[:12]}@test.com",
+            "name": f"Soak User {index}",
+            "password": "SoakTest123!"
+        }
+        self.soak["requests"] += 1
+        try:
+            token, user_id, _ = await self.authenticate("auth/register", registration_data)
+        except Exception:
+            token = None
+        if not token:
+            self.soak["errors"] += 1
+            return
+        self.soak["live"].add(user_id)
+        self.soak["created"] += 1
+        
+        try:
+            # Active: every online-users call marks the user as online
+            active_until = time.monotonic() + random.uniform(*active_range)
+            while time.monotonic() < active_until and not self.soak_stop.is_set():
+                self.soak["requests"] += 1
+                try:
+                    response = await self.request("GET", "community/online-users", token=token)
+                    if response.status_code == 200:
+                        self.soak["heartbeats"] += 1
+                    else:
+                        self.soak["errors"] += 1
+                except Exception:
+                    self.soak["errors"] += 1
+                await self.pause(SOAK_HEARTBEAT_INTERVAL)
+            
+            # Idle: no more heartbeats, stale cleanup should drop the user
+            if not self.soak_stop.is_set():
+                self.soak["idle_since"][user_id] = time.monotonic()
+                await self.pause(random.uniform(*idle_range))
+        finally:
+            deleted = await asyncio.to_thread(self.delete_user_from_db, user_id)
+            self.soak["idle_since"].pop(user_id, None)
+            self.soak["live"].discard(user_id)
+            if deleted:
+                self.soak["deleted_at"][user_id] = time.monotonic()
+                self.soak["awaiting_removal"].add(user_id)
+                self.soak["deleted"] += 1
+            elif not self.soak["delete_misses"]:
+                # MONGO_URL/DB_NAME is not the API's database: every ghost and latency would be made up
+                self.soak["delete_misses"] += 1
+                self.say(f"   ❌ User {user_id} not found in MongoDB - stopping soak")
+                self.soak_stop.set()
+            else:
+                self.soak["delete_misses"] += 1
+
+    async def soak_spawner(self, target_users, spawn_rate, active_range, idle_range):
+        """Keep the simulated population at target_users"""
+        index = 0
+        while not self.soak_stop.is_set():
+            if self.soak["population"] < target_users:
+                self.soak["population"] += 1
+                task = asyncio.create_task(self.soak_user_lifecycle(index, active_range, idle_range))
+                self.soak["tasks"].add(task)
+                task.add_done_callback(self.soak["tasks"].discard)
+                index += 1
+                await asyncio.sleep(1 / spawn_rate)
+            else:
+                await self.pause(1)
+
+    async def soak_sampler(self, observer_token, interval, started):
+        """Sample online-users and presence-status, checking for ghosts and stale users"""
+        deleted_at = self.soak["deleted_at"]
+        while not self.soak_stop.is_set():
+            await self.pause(interval)
+            # Only users deleted before the request went out can be ghosts in its response
+            sampled_at = time.monotonic()
+            self.soak["requests"] += 2
+            try:
+                response = await self.request("GET", "community/online-users", token=observer_token)
+                presence_response = await self.request("GET", "community/presence-status", token=observer_token)
+                if response.status_code != 200 or presence_response.status_code != 200:
+                    raise ValueError(f"status {response.status_code}/{presence_response.status_code}")
+                online_users = response.json()
+                presence = presence_response.json()
+                if not isinstance(online_users, list) or not isinstance(presence, dict):
+                    raise ValueError("unexpected response body")
+            except Exception as e:
+                self.soak["errors"] += 1
+                self.say(f"   ⚠️ Sample failed: {e}")
+                continue
+            
+            now = time.monotonic()
+            online_ids = {user.get('id') for user in online_users if isinstance(user, dict)}
+            ghosts = {user_id for user_id in online_ids if deleted_at.get(user_id, sampled_at) < sampled_at}
+            self.soak["ghost_ids"].update(ghosts)
+            
+            # Cleanup latency: idle/deleted users that have now left the online list
+            for user_id, since in list(self.soak["idle_since"].items()):
+                if user_id not in online_ids:
+                    self.soak["stale_latencies"].append(now - since)
+                    del self.soak["idle_since"][user_id]
+            for user_id in list(self.soak["awaiting_removal"]):
+                if user_id not in online_ids:
+                    self.soak["removal_latencies"].append(now - deleted_at[user_id])
+                    self.soak["awaiting_removal"].discard(user_id)
+            
+            # deleted_at is in deletion order, so expired entries are at the front
+            while deleted_at:
+                user_id, deleted = next(iter(deleted_at.items()))
+                if now - deleted < SOAK_DELETED_RETENTION:
+                    break
+                del deleted_at[user_id]
+                self.soak["awaiting_removal"].discard(user_id)
+            
+            cache_count = presence.get('cache_users_count', 0)
+            db_count = presence.get('db_users_count', 0)
+            elapsed = now - started
+            self.soak["samples"].append((elapsed, cache_count, len(online_ids)))
+            self.say(f"   [{elapsed:7.0f}s] live={len(self.soak['live'])} created={self.soak['created']} "
+                     f"deleted={self.soak['deleted']} online={len(online_ids)} cache={cache_count} db={db_count} "
+                     f"ghosts={len(ghosts)}")
+
+    async def test_presence_soak(self, duration, target_users, spawn_rate=20, sample_interval=30,
+                                 max_cache_users=None, max_cache_growth=None, max_error_rate=0.05,
+                                 active_range=(60, 600), idle_range=(60, 300)):
+        """Soak test: continuous presence churn must never produce ghosts or an unbounded cache"""
+        from pymongo import MongoClient
+        self.db = MongoClient(os.environ.get("MONGO_URL", "mongodb://localhost:27017"))[os.environ.get("DB_NAME", "test_database")]
+        max_cache_users = max_cache_users or target_users * 2
+        # Users/hour the cache may still grow once the population is steady; sustained growth is a leak
+        max_cache_growth = max_cache_growth if max_cache_growth is not None else target_users * 0.05
+        
+        self.say("🔍 GHOST USER SOAK TEST")
+        self.say(f"Duration: {duration}s, target users: {target_users}, cache bound: {max_cache_users}")
+        self.say("=" * 60)
+        
+        self.soak_stop = asyncio.Event()
+        self.soak = {
+            "live": set(), "population": 0, "tasks": set(), "created": 0, "deleted": 0, "heartbeats": 0, "errors": 0,
+            "requests": 0, "delete_misses": 0, "idle_since": {}, "deleted_at": {}, "awaiting_removal": set(), "ghost_ids": set(),
+            "stale_latencies": [], "removal_latencies": [], "samples": []
+        }
+        
+        observer_email = f"soak_observer_{uuid.uuid4().hex[:8]}@test.com"
+        observer_token, observer_id = await self.register_user("Soak Observer", observer_email, "SoakTest123!", test_name="Register Soak Observer")
+        if not observer_token:
+            self.say("❌ Cannot run soak without an observer user")
+            return False
+        
+        started = time.monotonic()
+        workers = [
+            asyncio.create_task(self.soak_spawner(target_users, spawn_rate, active_range, idle_range)),
+            asyncio.create_task(self.soak_sampler(observer_token, sample_interval, started))
+        ]
+        await self.pause(duration)
+        self.soak_stop.set()
+        await asyncio.gather(*workers)
+        # Lifecycles delete their users when stopping
+        await asyncio.gather(*list(self.soak["tasks"]), return_exceptions=True)
+        await asyncio.to_thread(self.delete_user_from_db, observer_id)
+        
+        samples = self.soak["samples"]
+        max_cache = max((sample[1] for sample in samples), default=0)
+        # Leak signal: cache trend over the second half of the run, after the population ramp-up
+        steady = samples[len(samples) // 2:]
+        cache_slope = slope_per_hour([(elapsed, cache) for elapsed, cache, _ in steady])
+        error_rate = self.soak["errors"] / self.soak["requests"] if self.soak["requests"] else 0
+        
+        self.say("\n📋 Soak Results")
+        self.say(f"   Users created/deleted: {self.soak['created']}/{self.soak['deleted']}, heartbeats: {self.soak['heartbeats']}, "
+                 f"errors: {self.soak['errors']}/{self.soak['requests']} requests, samples: {len(samples)}")
+        self.say(f"   Stale cleanup latency p50/p95/max: {percentile(self.soak['stale_latencies'], 50):.0f}s/"
+                 f"{percentile(self.soak['stale_latencies'], 95):.0f}s/{max(self.soak['stale_latencies'], default=0):.0f}s")
+        self.say(f"   Deleted-user removal latency p50/p95/max: {percentile(self.soak['removal_latencies'], 50):.0f}s/"
+                 f"{percentile(self.soak['removal_latencies'], 95):.0f}s/{max(self.soak['removal_latencies'], default=0):.0f}s")
+        self.say(f"   Presence cache: max {max_cache}, steady-state trend {cache_slope:+.1f} users/hour "
+                 f"(leak signal; backend memory is not measured)")
+        
+        # Without users, samples and deletions that reach the API's database, the checks below prove nothing
+        self.log_result("Soak: Users Created", self.soak["created"] > 0, None, "no simulated user was registered")
+        self.log_result("Soak: Users Deleted From API Database", self.soak["delete_misses"] == 0, None,
+                        f"{self.soak['delete_misses']} users not found in MongoDB - MONGO_URL/DB_NAME must be the database behind the API")
+        self.log_result("Soak: Enough Samples", len(steady) >= SOAK_MIN_STEADY_SAMPLES, None,
+                        f"{len(steady)} successful samples in the steady-state half (need {SOAK_MIN_STEADY_SAMPLES})")
+        self.log_result("Soak: Error Rate", error_rate <= max_error_rate, None,
+                        f"{error_rate:.1%} of requests failed (bound {max_error_rate:.1%})")
+        
+        ghost_count = len(self.soak["ghost_ids"])
+        self.log_result("Soak: Zero Ghost Users", ghost_count == 0, None, f"{ghost_count} deleted users appeared online")
+        self.log_result("Soak: Presence Cache Bounded", max_cache <= max_cache_users, None,
+                        f"cache reached {max_cache} users (bound {max_cache_users})")
+        self.log_result("Soak: Presence Cache Not Growing", cache_slope <= max_cache_growth, None,
+                        f"cache grew {cache_slope:+.1f} users/hour at steady state (bound {max_cache_growth:.1f})")
+        return len(self.failed_tests) == 0
+
+    async def run_soak_scenario(self, **options):
+        """Run the soak test on a pooled client sized for the simulated population"""
+        self.max_connections = 100
+        async with self:
+            return await self.test_presence_soak(**options)
+
     def run_tests(self):
         """Run all ghost user tests"""
         print("🚀 GHOST USER BUG FIX VERIFICATION")
         print(f"Testing against: {self.base_url}")
         print("=" * 60)
         
-        success = self.test_ghost_user_bug_fix()
+        success = asyncio.run(self.run_ghost_scenario())
         
         # Print summary
-        print("\n" + "=" * 60)
-        print("📊 GHOST USER TEST SUMMARY")
-        print("=" * 60)
-        print(f"Total Tests: {self.tests_run}")
-        print(f"Passed: {self.tests_passed}")
-        print(f"Failed: {len(self.failed_tests)}")
-        print(f"Success Rate: {(self.tests_passed/self.tests_run*100):.1f}%")
-        
-        if self.failed_tests:
-            print("\n❌ FAILED TESTS:")
-            for test in self.failed_tests:
-                print(f"  - {test['test']}: {test['error']}")
+        self.print_summary("GHOST USER TEST SUMMARY")
         
         if success and len(self.failed_tests) == 0:
             print("\n🎉 GHOST USER BUG FIX VERIFICATION: PASSED")
@@ -192,9 +370,44 @@ class GhostUserBugFixTester:
         
         return len(self.failed_tests) == 0
 
+    def run_soak(self, **options):
+        """Run the long-running presence soak test"""
+        print("🚀 GHOST USER SOAK TEST")
+        print(f"Testing against: {self.base_url}")
+        print("=" * 60)
+        
+        success = asyncio.run(self.run_soak_scenario(**options))
+        
+        self.print_summary("GHOST USER SOAK SUMMARY")
+        return success and len(self.failed_tests) == 0
+
 def main():
-    tester = GhostUserBugFixTester()
-    success = tester.run_tests()
+    parser = argparse.ArgumentParser(description="Ghost user bug fix verification")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL, help="API base URL (must share MONGO_URL's database for --soak)")
+    parser.add_argument("--soak", action="store_true", help="Run the long-running presence churn soak test (needs MONGO_URL)")
+    parser.add_argument("--duration", type=int, default=3600, help="Soak duration in seconds")
+    parser.add_argument("--users", type=int, default=1000, help="Simulated users kept alive at once")
+    parser.add_argument("--spawn-rate", type=float, default=20, help="New users registered per second")
+    parser.add_argument("--sample-interval", type=int, default=30, help="Seconds between online-users/presence samples")
+    parser.add_argument("--max-cache-users", type=int, default=None, help="Presence cache bound (default 2x --users)")
+    parser.add_argument("--max-cache-growth", type=float, default=None,
+                        help="Steady-state cache growth bound in users/hour (default 5%% of --users)")
+    parser.add_argument("--max-error-rate", type=float, default=0.05, help="Fraction of soak requests allowed to fail")
+    args = parser.parse_args()
+    
+    tester = GhostUserBugFixTester(args.base_url)
+    if args.soak:
+        success = tester.run_soak(
+            duration=args.duration,
+            target_users=args.users,
+            spawn_rate=args.spawn_rate,
+            sample_interval=args.sample_interval,
+            max_cache_users=args.max_cache_users,
+            max_cache_growth=args.max_cache_growth,
+            max_error_rate=args.max_error_rate
+        )
+    else:
+        success = tester.run_tests()
     return 0 if success else 1
 
 if __name__ == "__main__":
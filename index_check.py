@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+from pymongo import MongoClient, ASCENDING, DESCENDING
+from pymongo.errors import OperationFailure
+
+# Collection names must match /app/backend/server.py
+REQUIRED_INDEXES = {
+    "users": [
+        {"keys": [("id", ASCENDING)], "unique": True},
+        {"keys": [("email", ASCENDING)], "unique": True},
+    ],
+    "user_sessions": [
+        {"keys": [("session_token", ASCENDING)], "unique": True},
+        {"keys": [("user_id", ASCENDING)]},
+        # TTL: MongoDB removes sessions once expires_at has passed
+        {"keys": [("expires_at", ASCENDING)], "expireAfterSeconds": 0},
+    ],
+    "community_messages": [
+        {"keys": [("created_at", DESCENDING)]},
+        {"keys": [("user_id", ASCENDING), ("created_at", DESCENDING)]},
+    ],
+    "private_messages": [
+        {"keys": [("sender_id", ASCENDING), ("recipient_id", ASCENDING), ("created_at", DESCENDING)]},
+        {"keys": [("recipient_id", ASCENDING), ("created_at", DESCENDING)]},
+    ],
+    "itineraries": [
+        {"keys": [("id", ASCENDING)], "unique": True},
+        {"keys": [("user_id", ASCENDING), ("created_at", DESCENDING)]},
+    ],
+    "albums": [
+        {"keys": [("id", ASCENDING)], "unique": True},
+        {"keys": [("user_id", ASCENDING), ("created_at", DESCENDING)]},
+        {"keys": [("share_token", ASCENDING)], "sparse": True},
+    ],
+}
+
+# Query shapes issued by each endpoint; values are placeholders, only the shape matters for the plan
+ENDPOINT_QUERIES = [
+    ("GET /api/auth/me", "user_sessions", {"session_token": "x"}, None),
+    ("GET /api/auth/me", "users", {"id": "x"}, None),
+    ("POST /api/auth/login", "users", {"email": "x"}, None),
+    ("GET /api/community/messages", "community_messages", {}, [("created_at", DESCENDING)]),
+    ("DELETE /api/community/messages/clear-all", "community_messages", {"user_id": "x"}, None),
+    ("GET /api/messages/{partner_id}", "private_messages",
+     {"$or": [{"sender_id": "a", "recipient_id": "b"}, {"sender_id": "b", "recipient_id": "a"}]},
+     [("created_at", DESCENDING)]),
+    ("GET /api/messages/conversations", "private_messages",
+     {"$or": [{"sender_id": "a"}, {"recipient_id": "a"}]}, [("created_at", DESCENDING)]),
+    ("DELETE /api/messages/clear-all", "private_messages", {"sender_id": "x"}, None),
+    ("GET /api/itinerary/{id}", "itineraries", {"id": "x"}, None),
+    ("GET /api/itineraries/my", "itineraries", {"user_id": "x"}, [("created_at", DESCENDING)]),
+    ("GET /api/albums", "albums", {"user_id": "x"}, [("created_at", DESCENDING)]),
+    ("GET /api/albums/shared/{token}", "albums", {"share_token": "x"}, None),
+]
+
+
+def find_stages(plan):
+    """Collect every stage name in an explain() plan tree"""
+    stages = [plan.get("stage")]
+    for key in ("inputStage", "queryPlan"):
+        if key in plan:
+            stages.extend(find_stages(plan[key]))
+    for child in plan.get("inputStages", []):
+        stages.extend(find_stages(child))
+    return stages
+
+
+class MongoIndexChecker:
+    def __init__(self, mongo_url=None, db_name=None):
+        self.mongo_url = mongo_url or os.environ.get("MONGO_URL", "mongodb://localhost:27017")
+        self.db_name = db_name or os.environ.get("DB_NAME", "test_database")
+        self.db = MongoClient(self.mongo_url)[self.db_name]
+        self.tests_run = 0
+        self.tests_passed = 0
+        self.failed_tests = []
+
+    def log_result(self, test_name, success, error=None):
+        """Log test results"""
+        self.tests_run += 1
+        if success:
+            self.tests_passed += 1
+            print(f"✅ {test_name}")
+        else:
+            self.failed_tests.append({
+                "test": test_name,
+                "error": str(error) if error else "Unknown error"
+            })
+            print(f"❌ {test_name} - FAILED: {error}")
+
+    def provision_indexes(self):
+        """Create the required compound and TTL indexes (idempotent) on collections that already exist"""
+        print("\n🔧 Provisioning indexes...")
+        existing_collections = set(self.db.list_collection_names())
+        for collection, indexes in REQUIRED_INDEXES.items():
+            if collection not in existing_collections:
+                # create_index would create the collection, so a wrong name would then "pass" on an empty one
+                self.log_result(f"Provision {collection}", False, "collection does not exist - check the name against server.py")
+                continue
+            for spec in indexes:
+                options = {k: v for k, v in spec.items() if k != "keys"}
+                index_name = "_".join(f"{field}_{direction}" for field, direction in spec["keys"])
+                try:
+                    self.db[collection].create_index(spec["keys"], background=True, **options)
+                    self.log_result(f"Provision {collection}.{index_name}", True)
+                except OperationFailure as e:
+                    # e.g. same keys with different options, or duplicates blocking a unique index
+                    self.log_result(f"Provision {collection}.{index_name}", False, e.details.get("errmsg", str(e)) if e.details else str(e))
+
+    def check_required_indexes(self):
+        """Fail any required index (or collection) that does not exist"""
+        print("\n🔍 Checking required indexes...")
+        existing_collections = set(self.db.list_collection_names())
+        for collection, indexes in REQUIRED_INDEXES.items():
+            if collection not in existing_collections:
+                self.log_result(f"Collection {collection}", False, "collection does not exist")
+                continue
+            existing = {tuple(tuple(key) for key in info["key"]): info for info in self.db[collection].index_information().values()}
+            for spec in indexes:
+                keys = tuple((field, direction) for field, direction in spec["keys"])
+                index_name = "_".join(f"{field}_{direction}" for field, direction in keys)
+                info = existing.get(keys)
+                if info is None:
+                    self.log_result(f"Index {collection}.{index_name}", False, "index missing")
+                elif "expireAfterSeconds" in spec and info.get("expireAfterSeconds") != spec["expireAfterSeconds"]:
+                    self.log_result(f"Index {collection}.{index_name}", False, "index exists but is not a TTL index")
+                elif spec.get("unique") and not info.get("unique"):
+                    self.log_result(f"Index {collection}.{index_name}", False, "index exists but is not unique")
+                else:
+                    self.log_result(f"Index {collection}.{index_name}", True)
+
+    def check_query_plans(self):
+        """Fail any endpoint query whose winning plan is a COLLSCAN"""
+        print("\n🔍 Checking endpoint query plans...")
+        for endpoint, collection, query, sort in ENDPOINT_QUERIES:
+            command = {"find": collection, "filter": query}
+            if sort:
+                command["sort"] = dict(sort)
+            try:
+                explain = self.db.command("explain", command, verbosity="queryPlanner")
+                stages = find_stages(explain["queryPlanner"]["winningPlan"])
+                if "EOF" in stages:
+                    # A missing collection plans as EOF, which says nothing about its indexes
+                    self.log_result(f"{endpoint} ({collection})", False, "collection does not exist")
+                elif "COLLSCAN" in stages:
+                    self.log_result(f"{endpoint} ({collection})", False, f"COLLSCAN in plan: {' <- '.join(stages)}")
+                else:
+                    self.log_result(f"{endpoint} ({collection})", True)
+            except Exception as e:
+                self.log_result(f"{endpoint} ({collection})", False, str(e))
+
+    def run_checks(self, provision=False):
+        """Run index provisioning (optional), index existence and plan checks"""
+        print("🚀 MONGODB INDEX CHECK")
+        print(f"Database: {self.db_name}")
+        print("=" * 60)
+
+        if provision:
+            self.provision_indexes()
+
+        self.check_required_indexes()
+        self.check_query_plans()
+
+        print("\n" + "=" * 60)
+        print("📊 INDEX CHECK SUMMARY")
+        print("=" * 60)
+        print(f"Total Checks: {self.tests_run}")
+        print(f"Passed: {self.tests_passed}")
+        print(f"Failed: {len(self.failed_tests)}")
+
+        if self.failed_tests:
+            print("\n❌ FAILED CHECKS:")
+            for test in self.failed_tests:
+                print(f"  - {test['test']}: {test['error']}")
+
+        return len(self.failed_tests) == 0
+
+
+def main():
+    checker = MongoIndexChecker()
+    success = checker.run_checks(provision="--provision" in sys.argv)
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+
+import argparse
+import itertools
+import os
+import json
+import random
+import secrets
+import sys
+import time
+import uuid
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pymongo import MongoClient
+from pymongo.errors import BulkWriteError
+
+DIET_TYPES = ["halal", "vegetarian", "vegan", "jain", "non-veg"]
+ALLERGIES = ["peanuts", "tree nuts", "shellfish", "gluten", "dairy", "eggs", "soy", "sesame"]
+RESTRICTIONS = ["no beef", "no pork", "no alcohol", "no onion/garlic", "low sodium"]
+INTERESTS = ["food", "culture", "nature", "adventure", "history", "nightlife", "shopping", "beaches"]
+BUDGETS = ["budget", "mid-range", "luxury"]
+CITIES = [
+    "Paris, France", "Tokyo, Japan", "New York, USA", "London, UK", "Dubai, UAE", "Bali, Indonesia",
+    "Rome, Italy", "Barcelona, Spain", "Istanbul, Turkey", "Bangkok, Thailand", "Singapore", "Sydney, Australia",
+]
+TRIP_TYPES = ["romantic", "family", "solo", "adventure", "business", "cultural"]
+FIRST_NAMES = ["Aisha", "Ben", "Chen", "Diego", "Elena", "Farah", "Gita", "Hiro", "Ines", "Jamal", "Kofi", "Lena"]
+LAST_NAMES = ["Khan", "Smith", "Wang", "Garcia", "Rossi", "Haddad", "Patel", "Sato", "Silva", "Okafor"]
+ACTIVITIES = ["Museum visit", "Walking tour", "Food market", "Sunset viewpoint", "Boat cruise", "Local cooking class"]
+
+# Every seeded document carries this flag so --drop can remove exactly what was seeded
+SEED_FLAG = "is_seed"
+
+# Namespace for seeded user ids; combined with the per-run id so reruns never collide
+SEED_NAMESPACE = uuid.UUID("5eed5eed-0000-4000-8000-000000000000")
+
+
+def user_id_for(run_id, index):
+    """Deterministic id within a run so workers can reference users without a lookup"""
+    return str(uuid.uuid5(SEED_NAMESPACE, f"{run_id}:{index}"))
+
+
+def email_for(run_id, index):
+    return f"seed_{run_id}_{index}@seed.example.com"
+
+
+def user_name_for(seed, index):
+    """Deterministic per user, so messages carry the poster's real generated name"""
+    rng = random.Random(seed * 1_000_003 + index)
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+
+def zipf_cum_weights(count, exponent):
+    """Cumulative Zipf weights: rank r is picked with probability ~ 1 / r**exponent"""
+    return list(itertools.accumulate(1.0 / (rank ** exponent) for rank in range(1, count + 1)))
+
+
+def iso(ts):
+    return ts.isoformat()
+
+
+def make_user(index, rng, now, run_id, seed):
+    name = user_name_for(seed, index)
+    family = []
+    for _ in range(rng.choice([0, 0, 1, 2, 3])):
+        age = rng.randint(1, 70)
+        family.append({"name": rng.choice(FIRST_NAMES), "age": age, "is_under_5": age < 5})
+    user_id = user_id_for(run_id, index)
+    return {
+        "id": user_id,
+        "user_id": user_id,
+        "email": email_for(run_id, index),
+        "name": name,
+        "picture": "https://via.placeholder.com/150",
+        "age": rng.randint(18, 75),
+        "gender": rng.choice(["male", "female", "other"]),
+        "marital_status": rng.choice(["single", "married"]),
+        "food_preferences": {
+            "diet_type": rng.choice(DIET_TYPES),
+            "allergies": rng.sample(ALLERGIES, rng.choice([0, 0, 1, 2])),
+            "restrictions": rng.sample(RESTRICTIONS, rng.choice([0, 1])),
+        },
+        "budget_preferences": {
+            "daily_budget_min": 50 * rng.randint(1, 4),
+            "daily_budget_max": 100 * rng.randint(3, 10),
+            "trip_budget_preference": rng.choice(BUDGETS),
+        },
+        "travel_interests": rng.sample(INTERESTS, rng.randint(1, 4)),
+        "family_members": family,
+        "is_business_traveler": rng.random() < 0.2,
+        "location_approximate": rng.choice(CITIES),
+        "created_at": iso(now - timedelta(days=rng.randint(0, 730))),
+        SEED_FLAG: True,
+    }
+
+
+def make_session(index, now, run_id):
+    return {
+        "user_id": user_id_for(run_id, index),
+        # Random, so seeded sessions are not guessable bearer tokens; written to the sessions file instead
+        "session_token": secrets.token_urlsafe(32),
+        "expires_at": now + timedelta(days=7),
+        "created_at": now,
+        SEED_FLAG: True,
+    }
+
+
+def make_community_message(rng, now, users, cum_weights, run_id, seed):
+    poster = rng.choices(range(users), cum_weights=cum_weights)[0]
+    return {
+        "id": str(uuid.uuid4()),
+        "user_id": user_id_for(run_id, poster),
+        "user_name": user_name_for(seed, poster),
+        "message": f"Travel tip #{rng.randint(1, 10**6)}: {rng.choice(ACTIVITIES)} in {rng.choice(CITIES)}",
+        "location_approximate": rng.choice(CITIES),
+        "created_at": iso(now - timedelta(seconds=rng.randint(0, 90 * 86400))),
+        SEED_FLAG: True,
+    }
+
+
+def make_conversation(rng, now, users, cum_weights, length, run_id):
+    # Active posters also chat more, so partners are drawn from the same Zipf distribution
+    first, second = rng.choices(range(users), cum_weights=cum_weights, k=2)
+    if first == second:
+        second = (second + 1) % users
+    start = now - timedelta(seconds=rng.randint(0, 90 * 86400))
+    messages = []
+    for i in range(length):
+        sender, recipient = (first, second) if rng.random() < 0.5 else (second, first)
+        messages.append({
+            "id": str(uuid.uuid4()),
+            "sender_id": user_id_for(run_id, sender),
+            "recipient_id": user_id_for(run_id, recipient),
+            "content": f"Message {i + 1} about {rng.choice(CITIES)}",
+            "read": rng.random() < 0.8,
+            "created_at": iso(start + timedelta(minutes=i * rng.randint(1, 30))),
+            SEED_FLAG: True,
+        })
+    return messages
+
+
+def make_itinerary(rng, now, users, run_id):
+    owner = rng.randrange(users)
+    start = now + timedelta(days=rng.randint(-365, 180))
+    day_count = rng.randint(2, 10)
+    destination = rng.choice(CITIES)
+    days = []
+    for day in range(day_count):
+        days.append({
+            "day": day + 1,
+            "date": (start + timedelta(days=day)).strftime("%Y-%m-%d"),
+            "activities": [
+                {
+                    "time": f"{9 + slot * 3:02d}:00",
+                    "title": rng.choice(ACTIVITIES),
+                    "location": destination,
+                    "explanation": "Recommended for your interests and pace.",
+                    "estimated_cost": rng.randint(0, 150),
+                }
+                for slot in range(rng.randint(2, 4))
+            ],
+            "meals": [
+                {"type": meal, "suggestion": f"{rng.choice(DIET_TYPES).title()}-friendly local spot"}
+                for meal in ("breakfast", "lunch", "dinner")
+            ],
+        })
+    return {
+        "id": str(uuid.uuid4()),
+        "user_id": user_id_for(run_id, owner),
+        "destination": destination,
+        "start_date": start.strftime("%Y-%m-%d"),
+        "end_date": (start + timedelta(days=day_count - 1)).strftime("%Y-%m-%d"),
+        "trip_type": rng.choice(TRIP_TYPES),
+        "travelers_count": rng.randint(1, 5),
+        "days": days,
+        "created_at": iso(now - timedelta(days=rng.randint(0, 365))),
+        SEED_FLAG: True,
+    }
+
+
+def make_album(rng, now, users, run_id):
+    owner = rng.randrange(users)
+    is_public = rng.random() < 0.3
+    return {
+        "id": str(uuid.uuid4()),
+        "user_id": user_id_for(run_id, owner),
+        "name": f"{rng.choice(CITIES)} {rng.randint(2019, 2026)}",
+        "description": "Seeded album",
+        "is_public": is_public,
+        "share_token": uuid.uuid4().hex if is_public else None,
+        "media": [
+            {
+                "id": str(uuid.uuid4()),
+                "type": "video" if rng.random() < 0.1 else "photo",
+                "filename": f"{uuid.uuid4().hex}.jpg",
+                "caption": rng.choice(ACTIVITIES),
+                "size_bytes": rng.randint(200_000, 8_000_000),
+            }
+            for _ in range(rng.randint(0, 20))
+        ],
+        "created_at": iso(now - timedelta(days=rng.randint(0, 365))),
+        SEED_FLAG: True,
+    }
+
+
+# One client per worker process, opened by the pool initializer and shared by every chunk it runs
+_worker_db = None
+
+
+def init_worker(mongo_url, db_name):
+    global _worker_db
+    _worker_db = MongoClient(mongo_url)[db_name]
+
+
+def seed_chunk(job):
+    """Worker: generate one chunk of documents and insert it in batches"""
+    kind, start, count, options = job
+    rng = random.Random(options["seed"] * 1_000_003 + start * 31 + zlib.crc32(kind.encode()))
+    db = _worker_db
+    now = datetime.now(timezone.utc)
+    users = options["users"]
+    run_id, seed = options["run_id"], options["seed"]
+    cum_weights = zipf_cum_weights(users, options["zipf"]) if kind in ("community_messages", "private_messages") else None
+
+    if kind == "users":
+        docs = (make_user(i, rng, now, run_id, seed) for i in range(start, start + count))
+    elif kind == "user_sessions":
+        docs = (make_session(i, now, run_id) for i in range(start, start + count))
+    elif kind == "community_messages":
+        docs = (make_community_message(rng, now, users, cum_weights, run_id, seed) for _ in range(count))
+    elif kind == "private_messages":
+        length = options["messages_per_conversation"]
+        docs = itertools.chain.from_iterable(
+            make_conversation(rng, now, users, cum_weights, length, run_id) for _ in range(count)
+        )
+    elif kind == "itineraries":
+        docs = (make_itinerary(rng, now, users, run_id) for _ in range(count))
+    else:
+        docs = (make_album(rng, now, users, run_id) for _ in range(count))
+
+    inserted = 0
+    failed_total = 0
+    errors = []
+    sessions = []
+    batch_size = options["batch_size"]
+    while True:
+        batch = list(itertools.islice(docs, batch_size))
+        if not batch:
+            break
+        failed = set()
+        try:
+            db[kind].insert_many(batch, ordered=False)
+        except BulkWriteError as e:
+            # Unordered: the rest of the batch is still inserted, so record what failed and carry on
+            for error in e.details.get("writeErrors", []):
+                failed.add(error["index"])
+                if len(errors) < 5:
+                    errors.append(error.get("errmsg", str(error)))
+        inserted += len(batch) - len(failed)
+        failed_total += len(failed)
+        if kind == "user_sessions":
+            sessions.extend(
+                {"user_id": doc["user_id"], "session_token": doc["session_token"]}
+                for i, doc in enumerate(batch) if i not in failed
+            )
+    return kind, inserted, failed_total, errors, sessions
+
+
+class SyntheticDataSeeder:
+    def __init__(self, mongo_url=None, db_name=None, workers=None):
+        self.mongo_url = mongo_url or os.environ.get("MONGO_URL", "mongodb://localhost:27017")
+        self.db_name = db_name or os.environ.get("DB_NAME", "test_database")
+        self.workers = workers or os.cpu_count() or 4
+        self.db = MongoClient(self.mongo_url)[self.db_name]
+
+    def drop_seeded(self):
+        """Remove every document previously inserted by the seeder"""
+        print("\n🧹 Removing previously seeded documents...")
+        for kind in ("users", "user_sessions", "community_messages", "private_messages", "itineraries", "albums"):
+            result = self.db[kind].delete_many({SEED_FLAG: True})
+            print(f"   {kind}: {result.deleted_count} removed")
+
+    def plan_jobs(self, volumes, options, chunk_size):
+        """Split each collection's volume into chunks for the worker pool"""
+        jobs = []
+        for kind, total in volumes.items():
+            for start in range(0, total, chunk_size):
+                jobs.append((kind, start, min(chunk_size, total - start), options))
+        return jobs
+
+    def write_sessions(self, path, run_id, sessions):
+        """Write the seeded session tokens for the harnesses; owner-readable only, since they are live tokens"""
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({"run_id": run_id, "db_name": self.db_name, "sessions": sessions}, f)
+        print(f"\n🔑 Wrote {len(sessions):,} session tokens to {path}")
+
+    def seed(self, volumes, options, chunk_size=50_000, sessions_file=None):
+        """Generate and insert all volumes; returns (inserted, failed) counts per collection"""
+        print("🚀 SYNTHETIC DATA SEEDER")
+        print(f"Database: {self.db_name} ({self.workers} workers, run {options['run_id']})")
+        print("=" * 60)
+
+        counts = {kind: 0 for kind in volumes}
+        failures = {kind: 0 for kind in volumes}
+        sessions = []
+        started = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker,
+                                 initargs=(self.mongo_url, self.db_name)) as pool:
+            for kind, inserted, failed, errors, chunk_sessions in pool.map(seed_chunk, self.plan_jobs(volumes, options, chunk_size)):
+                counts[kind] += inserted
+                failures[kind] += failed
+                sessions.extend(chunk_sessions)
+                elapsed = time.perf_counter() - started
+                print(f"   {kind}: {counts[kind]} inserted ({sum(counts.values()) / elapsed:,.0f} docs/s)")
+                for error in errors:
+                    print(f"   ❌ {kind}: {error}")
+
+        if sessions_file and sessions:
+            self.write_sessions(sessions_file, options["run_id"], sessions)
+
+        elapsed = time.perf_counter() - started
+        print("\n" + "=" * 60)
+        print("📊 SEED SUMMARY")
+        print("=" * 60)
+        for kind, inserted in counts.items():
+            print(f"{kind}: {inserted:,}" + (f" ({failures[kind]:,} failed)" if failures[kind] else ""))
+        print(f"Total: {sum(counts.values()):,} documents in {elapsed:.1f}s")
+        if any(failures.values()):
+            print(f"❌ {sum(failures.values()):,} documents failed to insert")
+        return counts, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-load realistic synthetic data into MongoDB")
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--community-messages", type=int, default=100_000)
+    parser.add_argument("--conversations", type=int, default=20_000)
+    parser.add_argument("--messages-per-conversation", type=int, default=10)
+    parser.add_argument("--itineraries", type=int, default=20_000)
+    parser.add_argument("--albums", type=int, default=10_000)
+    parser.add_argument("--zipf", type=float, default=1.1, help="Zipf exponent for poster/chat activity")
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--drop", action="store_true", help="Remove previously seeded documents first")
+    parser.add_argument("--run-id", default=None, help="Namespace for seeded ids and emails (random by default)")
+    parser.add_argument("--sessions-file", default="seed_sessions.json", help="Where to write the seeded session tokens")
+    args = parser.parse_args()
+
+    if args.users < 2:
+        print("❌ --users must be at least 2")
+        return 1
+
+    seeder = SyntheticDataSeeder(workers=args.workers)
+    if args.drop:
+        seeder.drop_seeded()
+
+    volumes = {
+        "users": args.users,
+        "user_sessions": args.users,
+        "community_messages": args.community_messages,
+        "private_messages": args.conversations,
+        "itineraries": args.itineraries,
+        "albums": args.albums,
+    }
+    options = {
+        "users": args.users,
+        "zipf": args.zipf,
+        "messages_per_conversation": args.messages_per_conversation,
+        "batch_size": args.batch_size,
+        "seed": args.seed,
+        "run_id": args.run_id or secrets.token_hex(4),
+    }
+    _, failures = seeder.seed(volumes, options, sessions_file=args.sessions_file)
+    return 1 if any(failures.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())